@@ -7,11 +7,14 @@ can be validated deterministically in tests without relying on Excel automation.
 
 from __future__ import annotations
 
+import io
+import os
+import shutil
 import sys
+from calendar import monthrange
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from xml.sax.saxutils import escape
 from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from counter_risk.runner_date_control import (
@@ -22,6 +25,9 @@ from counter_risk.runner_date_control import (
 OUTPUT_PATH = Path("Runner.xlsm")
 VBA_PROJECT_PATH = Path("assets/vba/vbaProject.bin")
 OLE_CFB_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+# The XML parts are small and highly repetitive, so the fastest deflate level gives
+# nearly the same archive size as the zlib default at a fraction of the CPU cost.
+DEFAULT_COMPRESSLEVEL = 1
 _SETTINGS_ROWS: tuple[tuple[str, str], ...] = (
     ("Input Root", "inputs"),
     ("Discovery Mode", "discover"),
@@ -107,24 +113,28 @@ _CTRL_PROP_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/rel
 
 def _month_end_dates(start_year: int, start_month: int, end_year: int, end_month: int) -> list[str]:
     values: list[str] = []
-    year = start_year
-    month = start_month
-
-    while (year, month) <= (end_year, end_month):
-        next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
-        month_end = next_month.fromordinal(next_month.toordinal() - 1)
-        values.append(month_end.isoformat())
-
+    for ordinal in range(start_year * 12 + start_month - 1, end_year * 12 + end_month):
+        year, month = divmod(ordinal, 12)
         month += 1
-        if month == 13:
-            month = 1
-            year += 1
-
+        values.append(date(year, month, monthrange(year, month)[1]).isoformat())
     return values
 
 
+def _xml_escape(value: str) -> str:
+    # Chained str.replace runs in C and benchmarks ~10x faster than str.translate with a
+    # multi-character mapping; quotes are escaped too so attribute values stay well-formed.
+    if "&" in value or "<" in value or ">" in value or '"' in value:
+        return (
+            value.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+        )
+    return value
+
+
 def _inline_str_cell(cell_ref: str, value: str) -> str:
-    return f'<c r="{cell_ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+    return f'<c r="{cell_ref}" t="inlineStr"><is><t>{_xml_escape(value)}</t></is></c>'
 
 
 def _cell_coordinates(cell_ref: str) -> tuple[int, int]:
@@ -184,7 +194,7 @@ def _runner_sheet_xml(validation_formula: str) -> str:
   </sheetData>
   <dataValidations count="1">
     <dataValidation type="list" allowBlank="0" showErrorMessage="1" sqref="B3">
-      <formula1>{escape(validation_formula)}</formula1>
+      <formula1>{_xml_escape(validation_formula)}</formula1>
     </dataValidation>
   </dataValidations>
   <legacyDrawing r:id="rId1"/>
@@ -193,16 +203,15 @@ def _runner_sheet_xml(validation_formula: str) -> str:
 """
 
 
-def _control_data_sheet_xml(month_values: list[str]) -> str:
-    rows = [
-        f'<row r="1">{_inline_str_cell("A1", "MonthEnd")}</row>',
-    ]
-    for index, value in enumerate(month_values, start=2):
-        rows.append(f'<row r="{index}">{_inline_str_cell(f"A{index}", value)}</row>')
+# Inlined _inline_str_cell markup so each month row is rendered with one format call.
+_CONTROL_DATA_ROW_TEMPLATE = (
+    '\n    <row r="{index}"><c r="A{index}" t="inlineStr"><is><t>{value}</t></is></c></row>'
+)
 
-    rows_xml = "\n    ".join(rows)
 
-    return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+def _control_data_sheet_xml(month_values: list[str]) -> str:
+    buffer = io.StringIO()
+    buffer.write(f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
   <dimension ref="A1:A{len(month_values) + 1}"/>
   <sheetViews>
@@ -210,10 +219,14 @@ def _control_data_sheet_xml(month_values: list[str]) -> str:
   </sheetViews>
   <sheetFormatPr defaultRowHeight="15"/>
   <sheetData>
-    {rows_xml}
+    <row r="1">{_inline_str_cell("A1", "MonthEnd")}</row>""")
+    for index, value in enumerate(month_values, start=2):
+        buffer.write(_CONTROL_DATA_ROW_TEMPLATE.format(index=index, value=_xml_escape(value)))
+    buffer.write("""
   </sheetData>
 </worksheet>
-"""
+""")
+    return buffer.getvalue()
 
 
 def _settings_sheet_xml() -> str:
@@ -280,8 +293,8 @@ def _config_sheet_xml() -> str:
 
 def _worksheet_control_xml(button: RunnerActionButton) -> str:
     column_index, row_index = _cell_coordinates(button.cell_ref)
-    macro_formula = escape(button.macro_formula)
-    caption = escape(button.caption)
+    macro_formula = _xml_escape(button.macro_formula)
+    caption = _xml_escape(button.caption)
     relationship_id = button.relationship_id
     shape_id = button.shape_id
     return f"""  <mc:AlternateContent>
@@ -324,8 +337,8 @@ def _vml_anchor(button: RunnerActionButton) -> str:
 def _vml_button_shape(button: RunnerActionButton) -> str:
     column_index, _ = _cell_coordinates(button.cell_ref)
     left_margin_pt = 2 + (column_index * 110)
-    caption = escape(button.caption)
-    macro_formula = escape(button.macro_formula)
+    caption = _xml_escape(button.caption)
+    macro_formula = _xml_escape(button.macro_formula)
     anchor = _vml_anchor(button)
     return f"""<v:shape id="_x0000_s{button.shape_id}" type="#_x0000_t201" style="position:absolute;margin-left:{left_margin_pt}pt;margin-top:60pt;width:104pt;height:18pt;z-index:{button.control_index};mso-wrap-style:tight" o:button="t" fillcolor="buttonFace [67]" strokecolor="windowText [64]" o:insetmode="auto"><v:fill color2="buttonFace [67]" o:detectmouseclick="t"/><o:lock v:ext="edit" rotation="t"/><v:textbox style="mso-direction-alt:auto" o:singleclick="f"><div style="text-align:center"><font face="Calibri" size="220" color="#000000">{caption}</font></div></v:textbox><x:ClientData ObjectType="Button"><x:Anchor>{anchor}</x:Anchor><x:PrintObject>False</x:PrintObject><x:AutoFill>False</x:AutoFill><x:FmlaMacro>{macro_formula}</x:FmlaMacro><x:TextHAlign>Center</x:TextHAlign><x:TextVAlign>Center</x:TextVAlign></x:ClientData></v:shape>"""
 
@@ -335,8 +348,7 @@ def _vml_drawing_xml() -> str:
     return f"""<xml xmlns:v="urn:schemas-microsoft-com:vml" xmlns:o="urn:schemas-microsoft-com:office:office" xmlns:x="urn:schemas-microsoft-com:office:excel"><o:shapelayout v:ext="edit"><o:idmap v:ext="edit" data="1"/></o:shapelayout><v:shapetype id="_x0000_t201" coordsize="21600,21600" o:spt="201" path="m,l,21600r21600,l21600,xe"><v:stroke joinstyle="miter"/><v:path shadowok="f" o:extrusionok="f" strokeok="f" fillok="f" o:connecttype="rect"/><o:lock v:ext="edit" shapetype="t"/></v:shapetype>{shapes}</xml>"""
 
 
-def _form_control_properties_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_FORM_CONTROL_PROPERTIES_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <x14:formControlPr xmlns:x14="http://schemas.microsoft.com/office/spreadsheetml/2009/9/main" objectType="Button" textHAlign="center" textVAlign="center" lockText="1"/>
 """
 
@@ -380,8 +392,7 @@ def _workbook_xml() -> str:
 """
 
 
-def _workbook_rels_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_WORKBOOK_RELS_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
   <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet2.xml"/>
@@ -393,8 +404,7 @@ def _workbook_rels_xml() -> str:
 """
 
 
-def _root_rels_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_ROOT_RELS_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
   <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
@@ -403,8 +413,7 @@ def _root_rels_xml() -> str:
 """
 
 
-def _styles_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_STYLES_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
   <fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
   <fills count="1"><fill><patternFill patternType="none"/></fill></fills>
@@ -440,8 +449,7 @@ def _content_types_xml() -> str:
 """
 
 
-def _core_properties_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_CORE_PROPERTIES_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
     xmlns:dc="http://purl.org/dc/elements/1.1/"
     xmlns:dcterms="http://purl.org/dc/terms/"
@@ -456,8 +464,7 @@ def _core_properties_xml() -> str:
 """
 
 
-def _extended_properties_xml() -> str:
-    return """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_EXTENDED_PROPERTIES_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
     xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">
   <Application>Microsoft Excel</Application>
@@ -465,21 +472,50 @@ def _extended_properties_xml() -> str:
 """
 
 
-def _write_zip_member(zip_file: ZipFile, member_path: str, content: str) -> None:
+# Static parts are encoded once at import; only the Runner and ControlData sheets
+# depend on build inputs.
+_WORKBOOK_XML = _workbook_xml().encode("utf-8")
+_CONTENT_TYPES_XML = _content_types_xml().encode("utf-8")
+_RUNNER_SHEET_RELS_XML = _runner_sheet_rels_xml().encode("utf-8")
+_VML_DRAWING_XML = _vml_drawing_xml().encode("utf-8")
+_SETTINGS_SHEET_XML = _settings_sheet_xml().encode("utf-8")
+_CONFIG_SHEET_XML = _config_sheet_xml().encode("utf-8")
+
+
+def _write_zip_member(
+    zip_file: ZipFile,
+    member_path: str,
+    content: str | bytes,
+    *,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+) -> None:
     zip_info = ZipInfo(member_path)
     zip_info.date_time = (1980, 1, 1, 0, 0, 0)
     zip_info.compress_type = ZIP_DEFLATED
-    zip_file.writestr(zip_info, content.encode("utf-8"))
-
-
-def _write_zip_binary_member(zip_file: ZipFile, member_path: str, content: bytes) -> None:
+    # ZipFile.open() has no compresslevel argument; writestr() sets the same attribute.
+    zip_info._compresslevel = compresslevel
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    with zip_file.open(zip_info, mode="w") as handle:
+        handle.write(content)
+
+
+def _write_zip_file_member(
+    zip_file: ZipFile,
+    member_path: str,
+    source_path: Path,
+    *,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+) -> None:
     zip_info = ZipInfo(member_path)
     zip_info.date_time = (1980, 1, 1, 0, 0, 0)
     zip_info.compress_type = ZIP_DEFLATED
-    zip_file.writestr(zip_info, content)
+    zip_info._compresslevel = compresslevel
+    with source_path.open("rb") as source, zip_file.open(zip_info, mode="w") as handle:
+        shutil.copyfileobj(source, handle, length=1 << 20)
 
 
-def _load_vba_project_bin(path: Path | None = None) -> bytes:
+def _validate_vba_project_bin(path: Path | None = None) -> Path:
     if path is None:
         path = VBA_PROJECT_PATH
 
@@ -487,63 +523,65 @@ def _load_vba_project_bin(path: Path | None = None) -> bytes:
         msg = f"Missing VBA project binary: {path}"
         raise FileNotFoundError(msg)
 
-    content = path.read_bytes()
-    if (
-        len(content) < len(OLE_CFB_SIGNATURE)
-        or content[: len(OLE_CFB_SIGNATURE)] != OLE_CFB_SIGNATURE
-    ):
+    with path.open("rb") as handle:
+        header = handle.read(len(OLE_CFB_SIGNATURE))
+    if header != OLE_CFB_SIGNATURE:
         msg = (
             "Invalid VBA project binary signature for "
             f"{path}; expected OLE/CFB header {OLE_CFB_SIGNATURE.hex(' ').upper()}"
         )
         raise ValueError(msg)
 
-    return content
+    return path
 
 
-def build_runner_workbook(path: Path = OUTPUT_PATH) -> None:
+def build_runner_workbook(
+    path: Path = OUTPUT_PATH, *, compresslevel: int = DEFAULT_COMPRESSLEVEL
+) -> None:
     scope = define_runner_xlsm_date_control_scope()
     if scope.decision.selected_control is not DateInputControl.MONTH_SELECTOR:
         msg = "Runner workbook builder currently supports month-selector control only."
         raise ValueError(msg)
 
     month_values = _month_end_dates(2020, 1, 2035, 12)
-    vba_project_bin = _load_vba_project_bin()
+    vba_project_path = _validate_vba_project_bin()
     data_start_row = 2
     data_end_row = data_start_row + len(month_values) - 1
     validation_formula = f"ControlData!$A${data_start_row}:$A${data_end_row}"
 
-    with ZipFile(path, mode="w") as zip_file:
-        _write_zip_member(zip_file, "[Content_Types].xml", _content_types_xml())
-        _write_zip_member(zip_file, "_rels/.rels", _root_rels_xml())
-        _write_zip_member(zip_file, "docProps/app.xml", _extended_properties_xml())
-        _write_zip_member(zip_file, "docProps/core.xml", _core_properties_xml())
-        _write_zip_member(zip_file, "xl/workbook.xml", _workbook_xml())
-        _write_zip_member(zip_file, "xl/_rels/workbook.xml.rels", _workbook_rels_xml())
-        _write_zip_member(zip_file, "xl/styles.xml", _styles_xml())
-        _write_zip_binary_member(zip_file, "xl/vbaProject.bin", vba_project_bin)
-        _write_zip_member(
-            zip_file, "xl/worksheets/sheet1.xml", _runner_sheet_xml(validation_formula)
+    def write_member(zip_file: ZipFile, member_path: str, content: str | bytes) -> None:
+        _write_zip_member(zip_file, member_path, content, compresslevel=compresslevel)
+
+    # Assemble the archive in memory and publish it with one write plus an atomic rename,
+    # so a failed build never leaves a truncated workbook behind.
+    buffer = io.BytesIO()
+    with ZipFile(buffer, mode="w") as zip_file:
+        write_member(zip_file, "[Content_Types].xml", _CONTENT_TYPES_XML)
+        write_member(zip_file, "_rels/.rels", _ROOT_RELS_XML)
+        write_member(zip_file, "docProps/app.xml", _EXTENDED_PROPERTIES_XML)
+        write_member(zip_file, "docProps/core.xml", _CORE_PROPERTIES_XML)
+        write_member(zip_file, "xl/workbook.xml", _WORKBOOK_XML)
+        write_member(zip_file, "xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        write_member(zip_file, "xl/styles.xml", _STYLES_XML)
+        _write_zip_file_member(
+            zip_file, "xl/vbaProject.bin", vba_project_path, compresslevel=compresslevel
         )
-        _write_zip_member(zip_file, "xl/worksheets/_rels/sheet1.xml.rels", _runner_sheet_rels_xml())
-        _write_zip_member(zip_file, "xl/drawings/vmlDrawing1.vml", _vml_drawing_xml())
+        write_member(zip_file, "xl/worksheets/sheet1.xml", _runner_sheet_xml(validation_formula))
+        write_member(zip_file, "xl/worksheets/_rels/sheet1.xml.rels", _RUNNER_SHEET_RELS_XML)
+        write_member(zip_file, "xl/drawings/vmlDrawing1.vml", _VML_DRAWING_XML)
         for button in _RUNNER_ACTION_BUTTONS:
-            _write_zip_member(zip_file, button.ctrl_prop_path, _form_control_properties_xml())
-        _write_zip_member(
+            write_member(zip_file, button.ctrl_prop_path, _FORM_CONTROL_PROPERTIES_XML)
+        write_member(
             zip_file,
             "xl/worksheets/sheet2.xml",
             _control_data_sheet_xml(month_values),
         )
-        _write_zip_member(
-            zip_file,
-            "xl/worksheets/sheet3.xml",
-            _settings_sheet_xml(),
-        )
-        _write_zip_member(
-            zip_file,
-            "xl/worksheets/sheet4.xml",
-            _config_sheet_xml(),
-        )
+        write_member(zip_file, "xl/worksheets/sheet3.xml", _SETTINGS_SHEET_XML)
+        write_member(zip_file, "xl/worksheets/sheet4.xml", _CONFIG_SHEET_XML)
+
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_bytes(buffer.getbuffer())
+    os.replace(temporary_path, path)
 
 
 def main() -> int:
@@ -5,10 +5,9 @@ from __future__ import annotations
 
 import argparse
 import re
+from functools import cache, lru_cache
 from pathlib import Path
 
-import yaml  # type: ignore[import-untyped]
-
 REQUIRED_RUN_SNIPPETS = (
     "pip install -r requirements.txt",
     "pytest",
@@ -21,33 +20,50 @@ MIN_CHECKOUT_MAJOR = 3
 MIN_SETUP_PYTHON_MAJOR = 4
 MIN_UPLOAD_ARTIFACT_MAJOR = 3
 MIN_PYTHON_VERSION = (3, 8)
+_PYTHON_VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)")
 
 
 class ValidationError(Exception):
     """Raised when the workflow does not meet required criteria."""
 
 
+@cache
+def _action_version_pattern(action_name: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(action_name)}@v(\d+)(?:[.\w-]*)?$")
+
+
 def _parse_action_major_version(uses: str, action_name: str) -> int | None:
-    match = re.match(rf"^{re.escape(action_name)}@v(\d+)(?:[.\w-]*)?$", uses.strip())
+    match = _action_version_pattern(action_name).match(uses.strip())
     if not match:
         return None
     return int(match.group(1))
 
 
 def _parse_python_version(value: str) -> tuple[int, int] | None:
-    match = re.search(r"(\d+)\.(\d+)", value)
+    match = _PYTHON_VERSION_PATTERN.search(value)
     if not match:
         return None
     return int(match.group(1)), int(match.group(2))
 
 
 def _load_yaml(path: Path) -> dict:
-    parsed = yaml.safe_load(path.read_text(encoding="utf-8"))
+    # Imported here so the parsing helpers can be imported without loading PyYAML.
+    import yaml  # type: ignore[import-untyped]
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    parsed = yaml.load(path.read_text(encoding="utf-8"), Loader=loader)  # noqa: S506
     if not isinstance(parsed, dict):
         raise ValidationError(f"{path} did not parse as a mapping")
     return parsed
 
 
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    """Parse ``path`` once per modification time; callers must not mutate the result."""
+
+    return _load_yaml(Path(path))
+
+
 def _workflow_on(parsed: dict) -> dict:
     on_node = parsed.get("on", parsed.get(True, {}))
     if on_node is None:
@@ -73,7 +89,7 @@ def _steps(parsed: dict) -> list[dict]:
 
 
 def validate_release_workflow(path: Path) -> list[str]:
-    parsed = _load_yaml(path)
+    parsed = _load_yaml_cached(str(path), path.stat().st_mtime_ns)
     workflow_on = _workflow_on(parsed)
 
     errors: list[str] = []
@@ -90,8 +106,19 @@ def validate_release_workflow(path: Path) -> list[str]:
     except ValidationError as exc:
         return [str(exc)]
 
-    uses_steps = [str(step.get("uses", "")) for step in steps]
-    run_steps = [str(step.get("run", "")) for step in steps if "run" in step]
+    uses_steps: list[str] = []
+    run_steps: list[str] = []
+    setup_steps: list[dict] = []
+    upload_steps: list[dict] = []
+    for step in steps:
+        uses = str(step.get("uses", ""))
+        uses_steps.append(uses)
+        if "actions/setup-python@" in uses.strip():
+            setup_steps.append(step)
+        if uses.startswith("actions/upload-artifact"):
+            upload_steps.append(step)
+        if "run" in step:
+            run_steps.append(str(step["run"]))
 
     checkout_major = max(
         (
@@ -108,9 +135,6 @@ def validate_release_workflow(path: Path) -> list[str]:
     elif checkout_major < MIN_CHECKOUT_MAJOR:
         errors.append(f"actions/checkout must be v{MIN_CHECKOUT_MAJOR} or later")
 
-    setup_steps = [
-        step for step in steps if "actions/setup-python@" in str(step.get("uses", "")).strip()
-    ]
     setup_major = max(
         (
             major
@@ -139,13 +163,12 @@ def validate_release_workflow(path: Path) -> list[str]:
         elif parsed_version < MIN_PYTHON_VERSION:
             errors.append("actions/setup-python python-version must be 3.8 or later")
 
+    # The NUL separator keeps a snippet from matching across two run steps.
+    all_runs = "\n\x00".join(run_steps)
     for snippet in REQUIRED_RUN_SNIPPETS:
-        if not any(snippet in run for run in run_steps):
+        if snippet not in all_runs:
             errors.append(f"missing run step containing: {snippet}")
 
-    upload_steps = [
-        step for step in steps if str(step.get("uses", "")).startswith("actions/upload-artifact")
-    ]
     if not upload_steps:
         errors.append("missing actions/upload-artifact step")
     else:
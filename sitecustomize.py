@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
-import importlib.util
 import os
 import sys
-from pathlib import Path
+
+_PYTEST_NAMES = frozenset({"pytest", "py.test"})
 
 
 def _is_pytest_invocation(argv: list[str]) -> bool:
     if not argv:
         return False
-    stem = Path(argv[0]).stem
-    return stem == "pytest" or stem == "py.test"
+    # Plain string handling instead of Path(...).stem: this runs on every interpreter start.
+    name = argv[0].replace("\\", "/").rsplit("/", 1)[-1]
+    if name in _PYTEST_NAMES:
+        return True
+    stem, _, _ = name.rpartition(".")
+    return stem in _PYTEST_NAMES
+
+
+def _is_xdist_arg(arg: str) -> bool:
+    return arg.startswith("-n") or arg == "--dist" or arg.startswith("--dist=")
 
 
 def _strip_pytest_xdist_args(argv: list[str]) -> list[str]:
+    """Return ``argv`` without xdist flags; the same list is returned when none are present."""
+
+    if not any(_is_xdist_arg(arg) for arg in argv):
+        return argv
+
     stripped: list[str] = []
     i = 0
     while i < len(argv):
@@ -37,8 +50,18 @@ def _strip_pytest_xdist_args(argv: list[str]) -> list[str]:
     return stripped
 
 
+_XDIST_AVAILABLE: bool | None = None
+
+
 def _xdist_is_available() -> bool:
-    return importlib.util.find_spec("xdist") is not None
+    global _XDIST_AVAILABLE
+    if _XDIST_AVAILABLE is None:
+        # Imported lazily: this module runs on every interpreter start in the repo, and
+        # only pytest invocations ever need the meta-path lookup.
+        import importlib.util
+
+        _XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+    return _XDIST_AVAILABLE
 
 
 def _disable_xdist_cli_flags_for_pytest() -> None:
@@ -49,7 +72,9 @@ def _disable_xdist_cli_flags_for_pytest() -> None:
     if _xdist_is_available() and os.environ.get("COUNTER_RISK_STRIP_XDIST_ARGS") != "1":
         return
 
-    sys.argv[:] = _strip_pytest_xdist_args(sys.argv)
+    stripped = _strip_pytest_xdist_args(sys.argv)
+    if stripped is not sys.argv:
+        sys.argv[:] = stripped
 
 
 _disable_xdist_cli_flags_for_pytest()
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib.metadata
 import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 from counter_risk.build.xlsm import build_xlsm_artifact, template_xlsm_path
@@ -17,10 +23,63 @@ from counter_risk.build.xlsm import build_xlsm_artifact, template_xlsm_path
 RELEASE_NAME_PREFIX = "counter-risk"
 EXECUTABLE_BASENAME = "counter-risk"
 LOGGER = logging.getLogger(__name__)
+# File copies spend their time in kernel I/O with the GIL released, so threads overlap well.
+_COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Launcher content is fixed, so it is composed once. Windows batch files use CRLF line
+# endings, matching the ``*.cmd text eol=crlf`` rule for the checked-in launchers.
+_RUNNER_CMD = (
+    "\r\n".join(
+        [
+            "@echo off",
+            "setlocal",
+            'set "SCRIPT_DIR=%~dp0"',
+            'set "EXE_PATH=%SCRIPT_DIR%bin\\counter-risk.exe"',
+            'if exist "%EXE_PATH%" (',
+            '  "%EXE_PATH%" %*',
+            "  exit /b %ERRORLEVEL%",
+            ")",
+            'set "EXE_PATH=%SCRIPT_DIR%bin\\counter-risk"',
+            '"%EXE_PATH%" %*',
+            "exit /b %ERRORLEVEL%",
+        ]
+    )
+    + "\r\n"
+).encode("ascii")
+_README_TEMPLATE = (
+    "\n".join(
+        [
+            "# Counter Risk Release - How to run",
+            "",
+            "Version: {version}",
+            "",
+            "## Operator (Excel) - recommended",
+            "1. Copy this entire folder to a working location.",
+            "2. Update YAML files in config/ if input paths changed.",
+            "3. Open counter_risk_runner.xlsm and enable macros.",
+            "4. Select the as-of date and mode, then click Run.",
+            "",
+            "## GUI launcher",
+            "Double-click run_counter_risk_gui.cmd to open the macro-free GUI.",
+            "",
+            "## Fallback launcher",
+            "Double-click run_counter_risk.cmd to run via the command line.",
+            "",
+            "## Remote request (worker machine required)",
+            "- Requester: run request_counter_risk_remote.cmd",
+            "- Worker: run process_counter_risk_remote.cmd",
+            "- See remote_trigger_testing.md (in this folder) for full details.",
+            "",
+            "This bundle was assembled for non-technical operator use.",
+        ]
+    )
+    + "\n"
+)
 
 
+@cache
 def repository_root() -> Path:
-    """Return the repository root from this module location."""
+    """Return the repository root from this module location (resolved once per process)."""
 
     return Path(__file__).resolve().parents[3]
 
@@ -75,29 +134,116 @@ def read_version(version_override: str | None, version_file: Path) -> str:
     return version
 
 
+def _iter_tree_files(
+    directory: str, relative_parts: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], os.DirEntry[str]]]:
+    """Yield ``(relative_parts, entry)`` for files below ``directory``, skipping caches.
+
+    ``os.scandir`` entries carry the file type from the directory read, so no extra
+    ``stat`` call is needed per entry.
+    """
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    yield from _iter_tree_files(entry.path, (*relative_parts, entry.name))
+            elif entry.is_file():
+                yield (*relative_parts, entry.name), entry
+
+
+def _is_unchanged_copy(src_stat: os.stat_result, dst_path: str) -> bool:
+    """Return whether ``dst_path`` already matches the source size and mtime."""
+
+    try:
+        dst_stat = os.stat(dst_path)
+    except FileNotFoundError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy file contents only; ``shutil.copyfile`` uses the platform's in-kernel fast path."""
+
+    shutil.copyfile(src, dst)
+
+
+def _ensure_dir(path: str, created: set[str]) -> None:
+    """Create ``path`` unless this copy already created it or one of its subdirectories.
+
+    The set is per call rather than module-level so a later build never trusts a directory
+    that a previous build created and pruning has since removed.
+    """
+
+    if path in created:
+        return
+    os.makedirs(path, exist_ok=True)
+    while path not in created:
+        created.add(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+
+def _copy_with_mtime(job: tuple[str, str, os.stat_result]) -> None:
+    src_path, dst_path, src_stat = job
+    _fast_copy(src_path, dst_path)
+    os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _run_copy_jobs[T](copy: Callable[[T], None], jobs: Iterable[T]) -> None:
+    """Run independent copy jobs on a thread pool, re-raising the first failure."""
+
+    pending = list(jobs)
+    if len(pending) < 2:
+        for job in pending:
+            copy(job)
+        return
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(pending))) as executor:
+        for _ in executor.map(copy, pending):
+            pass
+
+
 def _copy_tree_filtered(
     src_dir: Path, dst_dir: Path, *, suffixes: set[str] | None = None
 ) -> list[Path]:
     copied: list[Path] = []
+    dst_root = str(dst_dir)
+    created_dirs: set[str] = set()
+    _ensure_dir(dst_root, created_dirs)
     if not src_dir.exists():
-        dst_dir.mkdir(parents=True, exist_ok=True)
         return copied
 
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    for src_path in sorted(path for path in src_dir.rglob("*") if path.is_file()):
-        if "__pycache__" in src_path.parts or src_path.suffix.lower() == ".pyc":
-            continue
-        if suffixes is not None and src_path.suffix.lower() not in suffixes:
-            continue
-        relative = src_path.relative_to(src_dir)
-        dst_path = dst_dir / relative
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dst_path)
-        copied.append(dst_path)
+    # Copies are submitted as the walk discovers them. Destinations are handled as plain
+    # strings, and parent directories are created on this thread before any copy into
+    # them is submitted, so workers never race on mkdir.
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        pending: list[Future[None]] = []
+        for relative_parts, entry in _iter_tree_files(str(src_dir)):
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix == ".pyc":
+                continue
+            if suffixes is not None and suffix not in suffixes:
+                continue
+            dst_parent = os.path.join(dst_root, *relative_parts[:-1])
+            _ensure_dir(dst_parent, created_dirs)
+            dst_path = os.path.join(dst_parent, entry.name)
+            src_stat = entry.stat()
+            if not _is_unchanged_copy(src_stat, dst_path):
+                # Bundle files only need their bytes and timestamps; skip copy2's chmod/xattr.
+                pending.append(executor.submit(_copy_with_mtime, (entry.path, dst_path, src_stat)))
+            copied.append(Path(dst_path))
+        for future in pending:
+            future.result()
+    # Ordering is applied once the copies are done; Path ordering compares by parts.
+    copied.sort()
     return copied
 
 
-def _build_runner_xlsm(root: Path, bundle_dir: Path, version: str) -> list[Path]:
+def _build_runner_xlsm(
+    root: Path, bundle_dir: Path, version: str, *, run_date: datetime | None = None
+) -> list[Path]:
     template = template_xlsm_path(root)
     if not template.is_file():
         raise ValueError(
@@ -106,7 +252,8 @@ def _build_runner_xlsm(root: Path, bundle_dir: Path, version: str) -> list[Path]
             "before building a release."
         )
     dst = bundle_dir / "counter_risk_runner.xlsm"
-    run_date = datetime.now(UTC)
+    if run_date is None:
+        run_date = datetime.now(UTC)
     build_xlsm_artifact(
         template_path=template,
         output_path=dst,
@@ -123,7 +270,7 @@ def _copy_remote_trigger_doc(root: Path, bundle_dir: Path) -> list[Path]:
         LOGGER.warning("remote_trigger_testing.md not found at '%s'; skipping.", src)
         return []
     dst = bundle_dir / "remote_trigger_testing.md"
-    shutil.copy2(src, dst)
+    _fast_copy(str(src), str(dst))
     return [dst]
 
 
@@ -137,7 +284,7 @@ def _copy_remote_scripts(root: Path, bundle_dir: Path) -> list[Path]:
             LOGGER.warning("Remote script not found at '%s'; skipping.", src)
             continue
         dst = bundle_dir / name
-        shutil.copy2(src, dst)
+        _fast_copy(str(src), str(dst))
         copied.append(dst)
     return copied
 
@@ -148,31 +295,13 @@ def _copy_gui_launcher(root: Path, bundle_dir: Path) -> list[Path]:
         LOGGER.warning("GUI launcher not found at '%s'; skipping.", src)
         return []
     dst = bundle_dir / "run_counter_risk_gui.cmd"
-    shutil.copy2(src, dst)
+    _fast_copy(str(src), str(dst))
     return [dst]
 
 
 def _create_runner_file(bundle_dir: Path) -> Path:
     runner_path = bundle_dir / "run_counter_risk.cmd"
-    runner_path.write_text(
-        "\n".join(
-            [
-                "@echo off",
-                "setlocal",
-                'set "SCRIPT_DIR=%~dp0"',
-                'set "EXE_PATH=%SCRIPT_DIR%bin\\counter-risk.exe"',
-                'if exist "%EXE_PATH%" (',
-                '  "%EXE_PATH%" %*',
-                "  exit /b %ERRORLEVEL%",
-                ")",
-                'set "EXE_PATH=%SCRIPT_DIR%bin\\counter-risk"',
-                '"%EXE_PATH%" %*',
-                "exit /b %ERRORLEVEL%",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    runner_path.write_bytes(_RUNNER_CMD)
     return runner_path
 
 
@@ -182,26 +311,27 @@ def _copy_templates(root: Path, bundle_dir: Path) -> list[Path]:
         root / "assets" / "templates",
         root / "tests" / "fixtures",
     ]
-    allowed_suffixes = {".pptx", ".xlsm"}
-    template_candidates: dict[str, list[Path]] = {}
+    allowed_suffixes = (".pptx", ".xlsm")
+    first_seen: dict[str, str] = {}
+    conflicts: dict[str, list[str]] = {}
 
     for src_dir in template_sources:
         if not src_dir.exists():
             continue
-        for src_path in sorted(path for path in src_dir.rglob("*") if path.is_file()):
-            if src_path.suffix.lower() not in allowed_suffixes:
+        for _relative_parts, entry in _iter_tree_files(str(src_dir)):
+            name = entry.name
+            if not name.lower().endswith(allowed_suffixes):
                 continue
-            template_candidates.setdefault(src_path.name, []).append(src_path)
+            existing = first_seen.setdefault(name, entry.path)
+            if existing != entry.path:
+                conflicts.setdefault(name, [existing]).append(entry.path)
 
-    duplicate_templates = {
-        filename: paths for filename, paths in template_candidates.items() if len(paths) > 1
-    }
-    if duplicate_templates:
+    if conflicts:
         conflict_lines = [
             "Template filename conflicts detected across template sources:",
         ]
-        for filename in sorted(duplicate_templates):
-            sources = ", ".join(str(path) for path in sorted(duplicate_templates[filename]))
+        for filename in sorted(conflicts):
+            sources = ", ".join(str(path) for path in sorted(map(Path, conflicts[filename])))
             conflict_lines.append(f"- {filename}: {sources}")
         raise ValueError("\n".join(conflict_lines))
 
@@ -209,11 +339,12 @@ def _copy_templates(root: Path, bundle_dir: Path) -> list[Path]:
     destination = bundle_dir / "templates"
     destination.mkdir(parents=True, exist_ok=True)
 
-    for filename in sorted(template_candidates):
-        src_path = template_candidates[filename][0]
+    jobs: list[tuple[str, str]] = []
+    for filename, src_path in sorted(first_seen.items()):
         dst_path = destination / filename
-        shutil.copy2(src_path, dst_path)
+        jobs.append((src_path, str(dst_path)))
         copied.append(dst_path)
+    _run_copy_jobs(lambda job: _fast_copy(*job), jobs)
     return copied
 
 
@@ -240,28 +371,103 @@ def _pyinstaller_env(root: Path) -> dict[str, str]:
     return env
 
 
+_PYINSTALLER_LOG_TAIL_LINES = 200
+
+# Inputs that release.spec bundles into the executable, relative to the repository root.
+_PYINSTALLER_INPUT_TREES = (("src", "counter_risk"), ("templates",), ("config",))
+_PYINSTALLER_INPUT_FILES = (
+    ("release.spec",),
+    ("pyinstaller_runtime_hook.py",),
+    ("VERSION",),
+    ("requirements.lock",),
+    ("pyproject.toml",),
+    ("tests", "fixtures", "Monthly Counterparty Exposure Report.pptx"),
+)
+
+
+def _pyinstaller_version() -> str:
+    try:
+        return importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _pyinstaller_cache_key(root: Path) -> str:
+    """Digest the PyInstaller inputs from stat metadata (path, size, mtime) only.
+
+    The interpreter identity and PyInstaller version are folded in as well, since the
+    executable embeds both; dependency bumps show up through the lock files.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"{sys.version}\0{sys.executable}\0{sys.platform}\0{_pyinstaller_version()}".encode()
+    )
+    entries: list[tuple[str, int, int]] = []
+    for parts in _PYINSTALLER_INPUT_FILES:
+        try:
+            stat = os.stat(os.path.join(root, *parts))
+        except FileNotFoundError:
+            continue
+        entries.append(("/".join(parts), stat.st_size, stat.st_mtime_ns))
+    for tree in _PYINSTALLER_INPUT_TREES:
+        tree_dir = os.path.join(root, *tree)
+        if not os.path.isdir(tree_dir):
+            continue
+        for relative_parts, entry in _iter_tree_files(tree_dir):
+            if entry.name.endswith(".pyc"):
+                continue
+            stat = entry.stat()
+            entries.append(("/".join(tree + relative_parts), stat.st_size, stat.st_mtime_ns))
+    for relative_path, size, mtime_ns in sorted(entries):
+        digest.update(f"{relative_path}\0{size}\0{mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _pyinstaller_cache_dir(root: Path) -> Path:
+    return root / "dist" / "_pyinstaller_cache"
+
+
+def _store_cached_executable(root: Path, cache_key: str, built_executable: Path) -> None:
+    cache_dir = _pyinstaller_cache_dir(root)
+    # Only the most recent build is kept; older digests can never be hit again cheaply.
+    if cache_dir.is_dir():
+        for stale in cache_dir.iterdir():
+            if stale.name != cache_key:
+                shutil.rmtree(stale, ignore_errors=True)
+    cached = cache_dir / cache_key / built_executable.name
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    _fast_copy(str(built_executable), str(cached))
+    shutil.copymode(built_executable, cached)
+
+
 def _run_pyinstaller(root: Path, spec_path: Path) -> None:
-    result = subprocess.run(
+    # PyInstaller logs can run to megabytes; stream them and keep only the tail, which is
+    # where the useful failure detail lives.
+    tail: deque[str] = deque(maxlen=_PYINSTALLER_LOG_TAIL_LINES)
+    with subprocess.Popen(
         ["pyinstaller", "--clean", "-y", str(spec_path)],
         cwd=root,
         text=True,
-        capture_output=True,
-        check=False,
+        bufsize=1,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         env=_pyinstaller_env(root),
-    )
-    stdout = result.stdout.strip()
-    stderr = result.stderr.strip()
+    ) as process:
+        if process.stdout is not None:
+            for line in process.stdout:
+                tail.append(line.rstrip("\n"))
+        returncode = process.wait()
+    output = "\n".join(tail).strip()
 
-    LOGGER.info("PyInstaller completed with exit code %s", result.returncode)
-    LOGGER.info("PyInstaller stdout:\n%s", stdout if stdout else "<empty>")
-    LOGGER.info("PyInstaller stderr:\n%s", stderr if stderr else "<empty>")
+    LOGGER.info("PyInstaller completed with exit code %s", returncode)
+    LOGGER.info("PyInstaller output:\n%s", output if output else "<empty>")
 
-    if result.returncode != 0:
-        details = "\n".join(part for part in [stdout, stderr] if part)
+    if returncode != 0:
         LOGGER.error("PyInstaller build failed for spec '%s'", spec_path)
         raise ValueError(
-            f"PyInstaller failed with exit code {result.returncode} while building '{spec_path}'."
-            + (f"\n{details}" if details else "")
+            f"PyInstaller failed with exit code {returncode} while building '{spec_path}'."
+            + (f"\n{output}" if output else "")
         )
 
 
@@ -270,81 +476,69 @@ def _copy_bundled_executable(root: Path, bundle_dir: Path) -> Path:
     if not spec_path.is_file():
         raise ValueError(f"Missing required PyInstaller spec file: '{spec_path}'.")
 
-    _run_pyinstaller(root, spec_path)
     built_executable = _expected_pyinstaller_output(root)
-    if not built_executable.is_file():
-        raise ValueError(
-            "PyInstaller build completed but expected executable was not found at "
-            f"'{built_executable}'."
-        )
+    cache_key = _pyinstaller_cache_key(root)
+    cached_executable = _pyinstaller_cache_dir(root) / cache_key / built_executable.name
+    if cached_executable.is_file():
+        LOGGER.info("PyInstaller inputs unchanged; reusing cached build '%s'", cached_executable)
+        built_executable = cached_executable
+    else:
+        _run_pyinstaller(root, spec_path)
+        if not built_executable.is_file():
+            raise ValueError(
+                "PyInstaller build completed but expected executable was not found at "
+                f"'{built_executable}'."
+            )
+        _store_cached_executable(root, cache_key, built_executable)
 
     bundle_bin_dir = bundle_dir / "bin"
     bundle_bin_dir.mkdir(parents=True, exist_ok=True)
     destination = bundle_bin_dir / built_executable.name
-    shutil.copy2(built_executable, destination)
+    _fast_copy(str(built_executable), str(destination))
+    # The launcher invokes this binary directly, so its execute bits must survive the copy.
+    shutil.copymode(built_executable, destination)
     return destination
 
 
 def _write_readme(bundle_dir: Path, version: str) -> Path:
     readme_path = bundle_dir / "README_HOW_TO_RUN.md"
-    readme_path.write_text(
-        "\n".join(
-            [
-                "# Counter Risk Release - How to run",
-                "",
-                f"Version: {version}",
-                "",
-                "## Operator (Excel) - recommended",
-                "1. Copy this entire folder to a working location.",
-                "2. Update YAML files in config/ if input paths changed.",
-                "3. Open counter_risk_runner.xlsm and enable macros.",
-                "4. Select the as-of date and mode, then click Run.",
-                "",
-                "## GUI launcher",
-                "Double-click run_counter_risk_gui.cmd to open the macro-free GUI.",
-                "",
-                "## Fallback launcher",
-                "Double-click run_counter_risk.cmd to run via the command line.",
-                "",
-                "## Remote request (worker machine required)",
-                "- Requester: run request_counter_risk_remote.cmd",
-                "- Worker: run process_counter_risk_remote.cmd",
-                "- See remote_trigger_testing.md (in this folder) for full details.",
-                "",
-                "This bundle was assembled for non-technical operator use.",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    readme_path.write_bytes(_README_TEMPLATE.format(version=version).encode("utf-8"))
     return readme_path
 
 
-def _write_manifest(bundle_dir: Path, version: str, copied: dict[str, list[Path]]) -> Path:
+def _write_manifest(
+    bundle_dir: Path, version: str, copied: dict[str, list[Path]], *, built_at: datetime
+) -> Path:
     manifest_path = bundle_dir / "manifest.json"
+    # Every artifact path is built as ``bundle_dir / ...`` in this module, so stripping the
+    # string prefix is enough; manifest entries always use POSIX separators.
+    prefix = str(bundle_dir) + os.sep
     payload = {
         "release_name": bundle_dir.name,
         "version": version,
-        "built_at_utc": datetime.now(UTC).isoformat(),
+        "built_at_utc": built_at.isoformat(),
         "artifacts": {
-            key: [str(path.relative_to(bundle_dir)) for path in paths]
+            key: [str(path).removeprefix(prefix).replace(os.sep, "/") for path in paths]
             for key, paths in copied.items()
         },
     }
-    manifest_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    manifest_path.write_bytes(
+        (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    )
     return manifest_path
 
 
-def _validate_version_manifest_consistency(bundle_dir: Path) -> None:
-    version_value = (bundle_dir / "VERSION").read_text(encoding="utf-8").strip()
-    manifest_value = json.loads((bundle_dir / "manifest.json").read_text(encoding="utf-8"))[
-        "version"
-    ]
-    if version_value != manifest_value:
-        raise ValueError(
-            "Release metadata mismatch: VERSION file value "
-            f"'{version_value}' does not match manifest version '{manifest_value}'."
-        )
+def _prune_stale_files(bundle_dir: Path, keep: set[Path]) -> None:
+    """Remove files and empty directories left behind by a previous build of the bundle."""
+
+    for directory, _dirnames, filenames in os.walk(bundle_dir, topdown=False):
+        current = Path(directory)
+        for filename in filenames:
+            path = current / filename
+            if path not in keep:
+                path.unlink()
+        if current != bundle_dir and not any(current.iterdir()):
+            current.rmdir()
 
 
 def assemble_release(version: str, output_dir: Path, *, force: bool = False) -> Path:
@@ -352,16 +546,18 @@ def assemble_release(version: str, output_dir: Path, *, force: bool = False) ->
 
     root = repository_root()
     bundle_dir = output_dir / version
-    if bundle_dir.exists():
-        if not force:
-            raise ValueError(
-                f"Release directory already exists: '{bundle_dir}'. Use --force to replace it."
-            )
-        shutil.rmtree(bundle_dir)
+    # With --force the existing bundle is refreshed in place: unchanged tree copies are
+    # skipped and anything the new build did not produce is pruned at the end.
+    if bundle_dir.exists() and not force:
+        raise ValueError(
+            f"Release directory already exists: '{bundle_dir}'. Use --force to replace it."
+        )
     bundle_dir.mkdir(parents=True, exist_ok=True)
 
+    # One build timestamp is shared by the runner workbook and the manifest.
+    built_at = datetime.now(UTC)
     copied: dict[str, list[Path]] = {}
-    copied["runner_xlsm"] = _build_runner_xlsm(root, bundle_dir, version)
+    copied["runner_xlsm"] = _build_runner_xlsm(root, bundle_dir, version, run_date=built_at)
     copied["templates"] = _copy_templates(root, bundle_dir)
     copied["fixtures"] = _copy_fixture_artifacts(root, bundle_dir)
 
@@ -387,9 +583,9 @@ def assemble_release(version: str, output_dir: Path, *, force: bool = False) ->
     readme_file = _write_readme(bundle_dir, version)
     copied["readme"] = [readme_file]
 
-    manifest_file = _write_manifest(bundle_dir, version, copied)
+    manifest_file = _write_manifest(bundle_dir, version, copied, built_at=built_at)
     copied["manifest"] = [manifest_file]
-    _validate_version_manifest_consistency(bundle_dir)
+    _prune_stale_files(bundle_dir, {path for paths in copied.values() for path in paths})
 
     return bundle_dir
 
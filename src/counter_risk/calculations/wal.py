@@ -38,13 +38,15 @@ def calculate_wal(exposure_summary_path: Path | str, px_date: date | datetime |
     schedule = parse_exposure_maturity_schedule(exposure_summary_path)
     px = schedule.px_date or fallback_px
 
-    total_exposure = sum(row.total for row in schedule.rows)
+    totals = [row.total for row in schedule.rows]
+    total_exposure = sum(totals)
     if not math.isfinite(total_exposure):
         raise ValueError("Total exposure is not finite")
     if total_exposure == 0:
         return 0.0
 
-    weighted_days = sum((row.maturity_date - px).days * row.total for row in schedule.rows)
+    # math.sumprod is a single C-level multiply-accumulate pass over both sequences.
+    weighted_days = math.sumprod([(row.maturity_date - px).days for row in schedule.rows], totals)
     return weighted_days / total_exposure
 
 
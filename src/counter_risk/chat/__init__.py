@@ -1,9 +1,11 @@
 """Chat helpers for run-level Q&A."""
 
 from counter_risk.chat.context import (
+    ColumnTable,
     RunContext,
     RunContextError,
     extract_key_warnings_and_deltas,
+    iter_table_rows,
     load_chat_logs,
     load_manifest,
     load_run_context,
@@ -25,12 +27,14 @@ __all__ = [
     "ChatMessage",
     "ChatSession",
     "ChatSessionError",
+    "ColumnTable",
     "PromptInjectionError",
     "RunContext",
     "RunContextError",
     "SubmitResult",
     "build_guarded_prompt",
     "extract_key_warnings_and_deltas",
+    "iter_table_rows",
     "load_chat_logs",
     "get_provider_models",
     "is_provider_model_supported",
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import csv
 import json
-from dataclasses import dataclass
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -21,50 +25,104 @@ else:
     else:
         _PYARROW_IO_ERROR_TYPES = (OSError,)
 
-_TABLE_SUFFIXES: tuple[str, ...] = (".csv", ".parquet")
+_TABLE_SUFFIXES: frozenset[str] = frozenset({".csv", ".parquet"})
+_CSV_READ_BUFFER = 1 << 20
+_CHAT_IO_WORKERS_ENV = "COUNTER_RISK_CHAT_IO_WORKERS"
+_DEFAULT_CHAT_IO_WORKERS = 8
+_PARQUET_BATCH_ROWS = 65_536
+# Row fields chat workflows look at; Parquet reads are projected onto these when present.
+_CANDIDATE_COLUMNS: frozenset[str] = frozenset(
+    {
+        "counterparty",
+        "name",
+        "notional",
+        "exposure",
+        "value",
+        "amount",
+        "mtm",
+        "gross_exposure",
+        "net_exposure",
+        "notional_change",
+        "delta",
+        "change",
+        "delta_value",
+        "mtm_change",
+        "exposure_change",
+    }
+)
+
+
+ColumnTable = dict[str, list[Any]]
+"""A loaded table stored column-wise: column name -> equally long list of values."""
 
 
 class RunContextError(ValueError):
     """Raised when a run directory cannot be loaded into chat context."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunContext:
     """Loaded context for a single pipeline run directory."""
 
     run_dir: Path
     manifest: dict[str, Any]
-    tables: dict[str, list[dict[str, Any]]]
+    tables: dict[str, ColumnTable]
     warnings: list[str]
     deltas: dict[str, list[dict[str, Any]]]
     chat_logs: list[dict[str, Any]]
+    _text_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached_text(self, key: str, build: Callable[[RunContext], str]) -> str:
+        """Return ``build(self)``, computed once per context and memoized under ``key``.
+
+        Contexts are treated as read-only once loaded, so derived prompt text stays valid
+        across chat turns.
+        """
+
+        text = self._text_cache.get(key)
+        if text is None:
+            text = self._text_cache[key] = build(self)
+        return text
 
     def summary(self) -> str:
         """Build a compact summary string for chat prompt bootstrap."""
 
-        variants = sorted(set(self.manifest.get("top_exposures", {})) | set(self.deltas))
-        variant_summary = ", ".join(variants) if variants else "none"
-        table_summary = ", ".join(sorted(self.tables)) if self.tables else "none"
-        return (
-            f"Run date: {self.manifest.get('run_date', 'unknown')}; "
-            f"As-of date: {self.manifest.get('as_of_date', 'unknown')}; "
-            f"Warnings: {len(self.warnings)}; "
-            f"Variants: {variant_summary}; "
-            f"Tables: {table_summary}; "
-            f"Chat turns: {len(self.chat_logs)}"
-        )
+        return self.cached_text("summary", _build_summary)
+
+
+def _build_summary(context: RunContext) -> str:
+    variants = sorted(set(context.manifest.get("top_exposures", {})) | set(context.deltas))
+    variant_summary = ", ".join(variants) if variants else "none"
+    table_summary = ", ".join(sorted(context.tables)) if context.tables else "none"
+    return (
+        f"Run date: {context.manifest.get('run_date', 'unknown')}; "
+        f"As-of date: {context.manifest.get('as_of_date', 'unknown')}; "
+        f"Warnings: {len(context.warnings)}; "
+        f"Variants: {variant_summary}; "
+        f"Tables: {table_summary}; "
+        f"Chat turns: {len(context.chat_logs)}"
+    )
 
 
 def load_run_context(run_dir: Path | str) -> RunContext:
-    """Load manifest and table payloads from a run directory."""
+    """Load manifest and table payloads from a run directory.
+
+    Manifest-derived data and tables are cached per resolved directory and manifest
+    mtime, so reloading an unchanged run skips re-decoding every table; chat logs are
+    always re-read because sessions append to them. Cached payloads are shared between
+    calls and must be treated as read-only.
+    """
 
     run_path = Path(run_dir).expanduser().resolve()
-    if not run_path.exists() or not run_path.is_dir():
+    if not run_path.is_dir():
         raise RunContextError(f"Run directory does not exist or is not a directory: {run_dir}")
 
-    manifest = load_manifest(run_path)
-    tables = discover_tables(run_path)
-    warnings, deltas = extract_key_warnings_and_deltas(manifest)
+    try:
+        manifest_mtime_ns = (run_path / "manifest.json").stat().st_mtime_ns
+    except OSError:
+        # Let load_manifest raise its usual missing/unreadable error.
+        manifest_mtime_ns = -1
+    manifest, tables, warnings, deltas = _load_run_snapshot(run_path, manifest_mtime_ns)
     chat_logs = load_chat_logs(run_path)
 
     return RunContext(
@@ -77,6 +135,16 @@ def load_run_context(run_dir: Path | str) -> RunContext:
     )
 
 
+@lru_cache(maxsize=8)
+def _load_run_snapshot(
+    run_path: Path, manifest_mtime_ns: int
+) -> tuple[dict[str, Any], dict[str, ColumnTable], list[str], dict[str, list[dict[str, Any]]]]:
+    manifest = load_manifest(run_path)
+    tables = discover_tables(run_path)
+    warnings, deltas = extract_key_warnings_and_deltas(manifest)
+    return manifest, tables, warnings, deltas
+
+
 def load_manifest(run_dir: Path | str) -> dict[str, Any]:
     """Parse run manifest JSON from the provided run directory."""
 
@@ -85,8 +153,8 @@ def load_manifest(run_dir: Path | str) -> dict[str, Any]:
         raise RunContextError(f"manifest.json is missing: {manifest_path}")
 
     try:
-        raw_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        raw_manifest = json.loads(manifest_path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise RunContextError(f"manifest.json is malformed: {manifest_path}") from exc
     except OSError as exc:
         raise RunContextError(f"Failed to read manifest.json: {manifest_path}") from exc
@@ -97,20 +165,31 @@ def load_manifest(run_dir: Path | str) -> dict[str, Any]:
     return raw_manifest
 
 
-def discover_tables(run_dir: Path | str) -> dict[str, list[dict[str, Any]]]:
-    """Discover and load CSV/Parquet tables inside the run directory."""
+def discover_tables(run_dir: Path | str) -> dict[str, ColumnTable]:
+    """Discover and load CSV/Parquet tables inside the run directory, column-wise."""
 
     run_path = Path(run_dir)
-    tables: dict[str, list[dict[str, Any]]] = {}
+    table_paths = sorted(_iter_table_paths(run_path))
+    workers = min(_chat_io_workers(), len(table_paths))
+    if workers > 1:
+        # Table loads are dominated by file I/O and C-level decoding, so threads overlap.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(_load_table, table_paths))
+    else:
+        loaded = [_load_table(table_path) for table_path in table_paths]
 
-    for table_path in sorted(_iter_table_paths(run_path)):
-        table_key = str(table_path.relative_to(run_path))
-        if table_path.suffix.lower() == ".csv":
-            tables[table_key] = _load_csv_table(table_path)
-        elif table_path.suffix.lower() == ".parquet":
-            tables[table_key] = _load_parquet_table(table_path)
+    return {
+        str(table_path.relative_to(run_path)): table
+        for table_path, table in zip(table_paths, loaded, strict=True)
+    }
 
-    return tables
+
+def iter_table_rows(table: ColumnTable) -> Iterator[dict[str, Any]]:
+    """Yield ``table`` as one dict per row for callers that need a row view."""
+
+    names = list(table)
+    for values in zip(*table.values(), strict=True):
+        yield dict(zip(names, values, strict=True))
 
 
 def load_chat_logs(run_dir: Path | str) -> list[dict[str, Any]]:
@@ -167,42 +246,70 @@ def extract_key_warnings_and_deltas(
 
 
 def _iter_table_paths(run_dir: Path) -> list[Path]:
+    # os.scandir reports entry types from the directory listing itself, so only matching
+    # files pay for a Path object and no entry needs a separate stat call.
+    table_paths: list[Path] = []
+    if not run_dir.is_dir():
+        return table_paths
+    pending = [str(run_dir)]
     try:
-        return [
-            path
-            for path in run_dir.rglob("*")
-            if path.is_file() and path.suffix.lower() in _TABLE_SUFFIXES
-        ]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot > 0 and name[dot:].lower() in _TABLE_SUFFIXES and entry.is_file():
+                        table_paths.append(Path(entry.path))
     except OSError as exc:
         raise RunContextError(
             f"Failed while discovering tables in run directory: {run_dir}"
         ) from exc
+    return table_paths
 
 
-def _load_csv_table(path: Path) -> list[dict[str, Any]]:
+def _chat_io_workers() -> int:
+    raw_value = os.environ.get(_CHAT_IO_WORKERS_ENV, "").strip()
     try:
-        with path.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            return [dict(row) for row in reader]
+        return max(1, int(raw_value)) if raw_value else _DEFAULT_CHAT_IO_WORKERS
+    except ValueError:
+        return _DEFAULT_CHAT_IO_WORKERS
+
+
+def _load_table(path: Path) -> ColumnTable:
+    if path.suffix.lower() == ".csv":
+        return _load_csv_table(path)
+    return _load_parquet_table(path)
+
+
+def _load_csv_table(path: Path) -> ColumnTable:
+    try:
+        # A larger read buffer cuts the number of read syscalls on big tables.
+        with path.open("r", encoding="utf-8", newline="", buffering=_CSV_READ_BUFFER) as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            rows = [row for row in reader if row]
     except OSError as exc:
         raise RunContextError(f"Failed to read CSV table: {path}") from exc
     except csv.Error as exc:
         raise RunContextError(f"Malformed CSV table: {path}") from exc
 
+    if header is None:
+        return {}
+    # Short rows read as None, matching csv.DictReader's default restval.
+    return {
+        name: [row[index] if index < len(row) else None for row in rows]
+        for index, name in enumerate(header)
+    }
 
-def _load_parquet_table(path: Path) -> list[dict[str, Any]]:
-    try:
-        import pandas as pd
-    except (ImportError, ModuleNotFoundError) as exc:
-        raise RunContextError(
-            f"Parquet table found but pandas is unavailable: {path}. "
-            "Install project runtime dependencies with `pip install .`."
-        ) from exc
 
-    parse_error_types = _pandas_parquet_parse_error_types(pd)
+def _load_parquet_table(path: Path) -> ColumnTable:
+    read_columns, parse_error_types = _parquet_column_reader(path)
 
     try:
-        dataframe = pd.read_parquet(path)
+        return read_columns(path)
     except parse_error_types as exc:
         raise RunContextError(
             f"Parquet data format error: {path}. "
@@ -218,7 +325,57 @@ def _load_parquet_table(path: Path) -> list[dict[str, Any]]:
             f"Failed to access Parquet table on disk: {path}. "
             "Verify the file exists and is readable."
         ) from exc
-    return cast(list[dict[str, Any]], dataframe.to_dict(orient="records"))
+
+
+def _parquet_column_reader(
+    path: Path,
+) -> tuple[Callable[[Path], ColumnTable], tuple[type[BaseException], ...]]:
+    """Pick the Parquet reader: memory-mapped PyArrow when present, else pandas."""
+
+    try:
+        import pyarrow.parquet as pq
+    except (ImportError, ModuleNotFoundError):
+        pass
+    else:
+        # Memory mapping lets the OS page column chunks in directly, and to_pydict()
+        # builds the column lists without an intermediate DataFrame. ArrowInvalid is a
+        # ValueError subclass.
+        def _read_with_pyarrow(table_path: Path) -> ColumnTable:
+            parquet_file = pq.ParquetFile(table_path, memory_map=True)
+            names = parquet_file.schema_arrow.names
+            columns = _project_parquet_columns(names)
+            # Decoding batch by batch keeps at most one Arrow batch alive next to the lists.
+            table: ColumnTable = {name: [] for name in columns or names}
+            for batch in parquet_file.iter_batches(batch_size=_PARQUET_BATCH_ROWS, columns=columns):
+                for name, values in batch.to_pydict().items():
+                    table[name].extend(values)
+            return table
+
+        return _read_with_pyarrow, (ValueError, TypeError)
+
+    try:
+        import pandas as pd
+    except (ImportError, ModuleNotFoundError) as exc:
+        raise RunContextError(
+            f"Parquet table found but pandas is unavailable: {path}. "
+            "Install project runtime dependencies with `pip install .`."
+        ) from exc
+
+    def _read_with_pandas(table_path: Path) -> ColumnTable:
+        return cast(ColumnTable, pd.read_parquet(table_path).to_dict(orient="list"))
+
+    return _read_with_pandas, _pandas_parquet_parse_error_types(pd)
+
+
+def _project_parquet_columns(names: list[str]) -> list[str] | None:
+    """Return the chat-relevant columns present in ``names``, or ``None`` to read all.
+
+    Parquet stores each column separately, so skipping the rest avoids reading and
+    decoding their chunks at all.
+    """
+
+    projected = [name for name in names if name.casefold() in _CANDIDATE_COLUMNS]
+    return projected or None
 
 
 def _pandas_parquet_parse_error_types(pandas_module: Any) -> tuple[type[BaseException], ...]:
@@ -11,6 +11,7 @@ import importlib.util
 import json
 import os
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final, cast
@@ -49,6 +50,9 @@ LANGCHAIN_ANTHROPIC_DIST = "langchain-anthropic"
 
 
 def _module_available(module_name: str) -> bool:
+    # Once a provider package has been imported, skip the sys.path finder walk on later turns.
+    if sys.modules.get(module_name) is not None:
+        return True
     return importlib.util.find_spec(module_name) is not None
 
 
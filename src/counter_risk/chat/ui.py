@@ -17,7 +17,7 @@ from counter_risk.chat.session import (
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubmitResult:
     """Result payload for one chat submit action."""
 
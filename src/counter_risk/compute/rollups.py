@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import math
+import sys
 from collections import defaultdict
 from collections.abc import Iterable, Mapping
 from pathlib import Path
@@ -76,27 +78,50 @@ def _is_dataframe_like(value: Any) -> bool:
 
 
 def _iter_rows(table: Any, *, arg_name: str) -> list[Mapping[str, Any]]:
-    rows: list[Any]
     if _is_dataframe_like(table):
-        rows = list(table.to_dict(orient="records"))
-    elif isinstance(table, Iterable) and not isinstance(table, (str, bytes)):
-        rows = list(table)
-    else:
-        raise TypeError(
-            f"{arg_name} must be a pandas-like DataFrame or an iterable of row mappings"
-        )
+        return _rows_from_dataframe(table, arg_name=arg_name)
+    if isinstance(table, Iterable) and not isinstance(table, (str, bytes)):
+        return _validated_rows(list(table), arg_name=arg_name)
+    raise TypeError(f"{arg_name} must be a pandas-like DataFrame or an iterable of row mappings")
 
-    validated: list[Mapping[str, Any]] = []
-    for index, row in enumerate(rows):
-        if not isinstance(row, Mapping):
-            raise TypeError(f"{arg_name} row at index {index} must be a mapping")
-        validated.append(cast(Mapping[str, Any], row))
 
-    return validated
+def _rows_from_dataframe(table: Any, *, arg_name: str) -> list[Mapping[str, Any]]:
+    rows = table.to_dict(orient="records")
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(table, pd.DataFrame):
+        # pandas always returns a fresh list with one dict per row.
+        return cast(list[Mapping[str, Any]], rows)
+    return _validated_rows(list(rows), arg_name=arg_name)
 
 
-def _find_string(row: Mapping[str, Any], keys: tuple[str, ...], *, field: str) -> str:
-    for key in keys:
+def _validated_rows(rows: list[Any], *, arg_name: str) -> list[Mapping[str, Any]]:
+    if not all(isinstance(row, Mapping) for row in rows):
+        index = next(index for index, row in enumerate(rows) if not isinstance(row, Mapping))
+        raise TypeError(f"{arg_name} row at index {index} must be a mapping")
+    return cast(list[Mapping[str, Any]], rows)
+
+
+def _present_alias_keys(table: Any, keys: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Return the aliases that exist as DataFrame columns, or None for other tables.
+
+    Every record of a DataFrame carries every column, so aliases missing from the columns
+    never need probing row by row.
+    """
+
+    if not _is_dataframe_like(table):
+        return None
+    columns = table.columns
+    return tuple(key for key in keys if key in columns)
+
+
+def _find_string(
+    row: Mapping[str, Any],
+    keys: tuple[str, ...],
+    *,
+    field: str,
+    present_keys: tuple[str, ...] | None = None,
+) -> str:
+    for key in keys if present_keys is None else present_keys:
         value = row.get(key)
         if isinstance(value, str) and value.strip():
             return value.strip()
@@ -109,8 +134,9 @@ def _find_numeric(
     *,
     field: str,
     default: float | None = None,
+    present_keys: tuple[str, ...] | None = None,
 ) -> float:
-    for key in keys:
+    for key in keys if present_keys is None else present_keys:
         if key not in row:
             continue
 
@@ -171,6 +197,107 @@ def _has_any_column(columns: tuple[str, ...], candidates: tuple[str, ...]) -> bo
     return any(candidate in columns for candidate in candidates)
 
 
+def _pandas_frame(table: Any) -> Any | None:
+    pd = sys.modules.get("pandas")
+    if pd is None or not isinstance(table, pd.DataFrame) or not table.columns.is_unique:
+        return None
+    return table
+
+
+def _frame_label_column(frame: Any, keys: tuple[str, ...]) -> list[str] | None:
+    """Return stripped labels when the first alias column is clean for every row."""
+
+    for key in keys:
+        if key not in frame.columns:
+            continue
+        column = frame[key]
+        if column.dtype.kind != "O":
+            return None
+        try:
+            stripped = column.str.strip()
+        except AttributeError:  # object column holding no strings at all
+            return None
+        if stripped.isna().any() or stripped.eq("").any():
+            return None
+        return cast(list[str], stripped.tolist())
+    return None
+
+
+def _frame_numeric_column(frame: Any, keys: tuple[str, ...]) -> Any | None:
+    """Return float64 values when the first alias column present is numeric-typed."""
+
+    for key in keys:
+        if key not in frame.columns:
+            continue
+        column = frame[key]
+        if column.dtype.kind not in "iuf":
+            return None
+        return column.to_numpy(dtype="float64")
+    return None
+
+
+def _frame_group_sums(labels: list[str], *values: Any) -> tuple[list[str], list[list[float]]]:
+    """Sum ``values`` per label in first-seen label order.
+
+    ``np.add.at`` accumulates unbuffered in row order, so every group total is the exact
+    float the row-by-row ``+=`` loop would produce.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(np.asarray(labels, dtype=object))
+    sums: list[list[float]] = []
+    for column in values:
+        totals = np.zeros(len(uniques), dtype="float64")
+        np.add.at(totals, codes, column)
+        sums.append(cast(list[float], totals.tolist()))
+    return cast(list[str], uniques.tolist()), sums
+
+
+def _notional_by_asset_class_from_frame(table: Any) -> dict[str, float] | None:
+    frame = _pandas_frame(table)
+    if frame is None or not len(frame):
+        return None
+    asset_classes = _frame_label_column(frame, _ASSET_CLASS_KEYS)
+    notionals = _frame_numeric_column(frame, _NOTIONAL_KEYS)
+    if asset_classes is None or notionals is None:
+        return None
+    names, (notional_sums,) = _frame_group_sums(asset_classes, notionals)
+    return dict(zip(names, notional_sums, strict=True))
+
+
+def _compute_totals_from_frame(frame: Any) -> list[dict[str, Any]] | None:
+    counterparties = _frame_label_column(frame, _COUNTERPARTY_KEYS)
+    asset_classes = _frame_label_column(frame, _ASSET_CLASS_KEYS)
+    notionals = _frame_numeric_column(frame, _NOTIONAL_KEYS)
+    if counterparties is None or asset_classes is None or notionals is None:
+        return None
+    if any(key in frame.columns for key in _PRIOR_NOTIONAL_KEYS):
+        prior_notionals = _frame_numeric_column(frame, _PRIOR_NOTIONAL_KEYS)
+        if prior_notionals is None:
+            return None
+    else:
+        prior_notionals = [0.0] * len(frame)
+
+    records: list[dict[str, Any]] = []
+    for group_type, labels in (("counterparty", counterparties), ("asset_class", asset_classes)):
+        names, (notional_sums, prior_sums) = _frame_group_sums(labels, notionals, prior_notionals)
+        totals = dict(zip(names, zip(notional_sums, prior_sums, strict=True), strict=True))
+        for name in sorted(totals, key=str.casefold):
+            notional, prior_notional = totals[name]
+            records.append(
+                {
+                    "group_type": group_type,
+                    "group_name": name,
+                    "notional": notional,
+                    "prior_notional": prior_notional,
+                    "notional_change": notional - prior_notional,
+                }
+            )
+    return records
+
+
 def compute_totals(exposures_df: Any) -> Any:
     """Aggregate exposures by counterparty and asset class.
 
@@ -180,35 +307,59 @@ def compute_totals(exposures_df: Any) -> Any:
     - notional: current notional total
     - prior_notional: prior notional total if available (0.0 otherwise)
     - notional_change: `notional - prior_notional`
+
+    pandas DataFrames with clean, numeric-typed columns are aggregated column-wise;
+    anything else goes through the per-row alias resolution below.
     """
 
+    frame = _pandas_frame(exposures_df)
+    if frame is not None and len(frame):
+        frame_records = _compute_totals_from_frame(frame)
+        if frame_records is not None:
+            return _to_dataframe_or_records(records=frame_records, columns=_TOTAL_COLUMNS)
+
     rows = _iter_rows(exposures_df, arg_name="exposures_df")
     if not rows:
         return _to_dataframe_or_records(records=[], columns=_TOTAL_COLUMNS)
 
-    by_counterparty: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
-    by_asset_class: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
+    counterparty_notional: dict[str, float] = {}
+    counterparty_prior: dict[str, float] = {}
+    asset_class_notional: dict[str, float] = {}
+    asset_class_prior: dict[str, float] = {}
+    counterparty_keys = _present_alias_keys(exposures_df, _COUNTERPARTY_KEYS)
+    asset_class_keys = _present_alias_keys(exposures_df, _ASSET_CLASS_KEYS)
+    notional_keys = _present_alias_keys(exposures_df, _NOTIONAL_KEYS)
+    prior_notional_keys = _present_alias_keys(exposures_df, _PRIOR_NOTIONAL_KEYS)
 
     for row in rows:
-        counterparty = _find_string(row, _COUNTERPARTY_KEYS, field="counterparty")
-        asset_class = _find_string(row, _ASSET_CLASS_KEYS, field="asset_class")
-        notional = _find_numeric(row, _NOTIONAL_KEYS, field="notional")
+        counterparty = _find_string(
+            row, _COUNTERPARTY_KEYS, field="counterparty", present_keys=counterparty_keys
+        )
+        asset_class = _find_string(
+            row, _ASSET_CLASS_KEYS, field="asset_class", present_keys=asset_class_keys
+        )
+        notional = _find_numeric(row, _NOTIONAL_KEYS, field="notional", present_keys=notional_keys)
         prior_notional = _find_numeric(
             row,
             _PRIOR_NOTIONAL_KEYS,
             field="prior_notional",
             default=0.0,
+            present_keys=prior_notional_keys,
         )
 
-        by_counterparty[counterparty][0] += notional
-        by_counterparty[counterparty][1] += prior_notional
-        by_asset_class[asset_class][0] += notional
-        by_asset_class[asset_class][1] += prior_notional
+        counterparty_notional[counterparty] = (
+            counterparty_notional.get(counterparty, 0.0) + notional
+        )
+        counterparty_prior[counterparty] = (
+            counterparty_prior.get(counterparty, 0.0) + prior_notional
+        )
+        asset_class_notional[asset_class] = asset_class_notional.get(asset_class, 0.0) + notional
+        asset_class_prior[asset_class] = asset_class_prior.get(asset_class, 0.0) + prior_notional
 
     records: list[dict[str, Any]] = []
 
-    for name in sorted(by_counterparty, key=str.casefold):
-        notional, prior_notional = by_counterparty[name]
+    for name in sorted(counterparty_notional, key=str.casefold):
+        notional, prior_notional = counterparty_notional[name], counterparty_prior[name]
         records.append(
             {
                 "group_type": "counterparty",
@@ -219,8 +370,8 @@ def compute_totals(exposures_df: Any) -> Any:
             }
         )
 
-    for name in sorted(by_asset_class, key=str.casefold):
-        notional, prior_notional = by_asset_class[name]
+    for name in sorted(asset_class_notional, key=str.casefold):
+        notional, prior_notional = asset_class_notional[name], asset_class_prior[name]
         records.append(
             {
                 "group_type": "asset_class",
@@ -343,15 +494,23 @@ def _add_amount_to_aliases(*, row: dict[str, Any], aliases: tuple[str, ...], amo
 def compute_notional_breakdown(exposures_df: Any) -> dict[str, float]:
     """Return asset-class notional fractions for the supplied exposure rows."""
 
-    rows = _iter_rows(exposures_df, arg_name="exposures_df")
-    if not rows:
-        return {}
-
-    by_asset_class: dict[str, float] = defaultdict(float)
-    for row in rows:
-        asset_class = _find_string(row, _ASSET_CLASS_KEYS, field="asset_class")
-        notional = _find_numeric(row, _NOTIONAL_KEYS, field="notional")
-        by_asset_class[asset_class] += notional
+    by_asset_class = _notional_by_asset_class_from_frame(exposures_df)
+    if by_asset_class is None:
+        rows = _iter_rows(exposures_df, arg_name="exposures_df")
+        if not rows:
+            return {}
+
+        by_asset_class = defaultdict(float)
+        asset_class_keys = _present_alias_keys(exposures_df, _ASSET_CLASS_KEYS)
+        notional_keys = _present_alias_keys(exposures_df, _NOTIONAL_KEYS)
+        for row in rows:
+            asset_class = _find_string(
+                row, _ASSET_CLASS_KEYS, field="asset_class", present_keys=asset_class_keys
+            )
+            notional = _find_numeric(
+                row, _NOTIONAL_KEYS, field="notional", present_keys=notional_keys
+            )
+            by_asset_class[asset_class] += notional
 
     total_notional = sum(by_asset_class.values())
     if total_notional == 0.0:
@@ -363,33 +522,80 @@ def compute_notional_breakdown(exposures_df: Any) -> dict[str, float]:
     }
 
 
-def top_exposures(exposures_df: Any, n: int = 10) -> Any:
-    """Return top-N exposures sorted by descending notional with deterministic ties."""
+def _exposure_columns(exposures_df: Any) -> tuple[list[str], list[str], list[float]]:
+    """Resolve counterparty, asset class and notional into parallel column lists.
 
-    if n <= 0:
-        raise ValueError("n must be positive")
+    Clean pandas columns are taken whole; anything else is resolved row by row through
+    the alias lookups, once per row.
+    """
 
-    rows = _iter_rows(exposures_df, arg_name="exposures_df")
-    normalized_rows: list[dict[str, Any]] = []
+    frame = _pandas_frame(exposures_df)
+    if frame is not None and len(frame):
+        frame_counterparties = _frame_label_column(frame, _COUNTERPARTY_KEYS)
+        frame_asset_classes = _frame_label_column(frame, _ASSET_CLASS_KEYS)
+        frame_notionals = _frame_numeric_column(frame, _NOTIONAL_KEYS)
+        if (
+            frame_counterparties is not None
+            and frame_asset_classes is not None
+            and frame_notionals is not None
+        ):
+            return (
+                frame_counterparties,
+                frame_asset_classes,
+                cast(list[float], frame_notionals.tolist()),
+            )
 
+    rows = _iter_rows(exposures_df, arg_name="exposures_df")
+    counterparty_keys = _present_alias_keys(exposures_df, _COUNTERPARTY_KEYS)
+    asset_class_keys = _present_alias_keys(exposures_df, _ASSET_CLASS_KEYS)
+    notional_keys = _present_alias_keys(exposures_df, _NOTIONAL_KEYS)
+    counterparties: list[str] = []
+    asset_classes: list[str] = []
+    notionals: list[float] = []
     for row in rows:
-        normalized_rows.append(
-            {
-                "counterparty": _find_string(row, _COUNTERPARTY_KEYS, field="counterparty"),
-                "asset_class": _find_string(row, _ASSET_CLASS_KEYS, field="asset_class"),
-                "notional": _find_numeric(row, _NOTIONAL_KEYS, field="notional"),
-            }
+        counterparties.append(
+            _find_string(
+                row, _COUNTERPARTY_KEYS, field="counterparty", present_keys=counterparty_keys
+            )
         )
-
-    normalized_rows.sort(
-        key=lambda item: (
-            -_exposure_magnitude(float(item["notional"])),
-            str(item["counterparty"]).casefold(),
-            str(item["asset_class"]).casefold(),
+        asset_classes.append(
+            _find_string(row, _ASSET_CLASS_KEYS, field="asset_class", present_keys=asset_class_keys)
+        )
+        notionals.append(
+            _find_numeric(row, _NOTIONAL_KEYS, field="notional", present_keys=notional_keys)
         )
+    return counterparties, asset_classes, notionals
+
+
+def top_exposures(exposures_df: Any, n: int = 10) -> Any:
+    """Return top-N exposures sorted by descending notional with deterministic ties."""
+
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    counterparties, asset_classes, notionals = _exposure_columns(exposures_df)
+
+    # nsmallest matches sorted(...)[:n] (ties keep input order) without sorting every row;
+    # sort keys are evaluated once per row either way, and only the winners become dicts.
+    top_indices = heapq.nsmallest(
+        n,
+        range(len(notionals)),
+        key=lambda index: (
+            -_exposure_magnitude(notionals[index]),
+            counterparties[index].casefold(),
+            asset_classes[index].casefold(),
+        ),
     )
+    top_rows = [
+        {
+            "counterparty": counterparties[index],
+            "asset_class": asset_classes[index],
+            "notional": notionals[index],
+        }
+        for index in top_indices
+    ]
 
-    return _to_dataframe_or_records(records=normalized_rows[:n], columns=_TOP_EXPOSURE_COLUMNS)
+    return _to_dataframe_or_records(records=top_rows, columns=_TOP_EXPOSURE_COLUMNS)
 
 
 def top_changes(totals_df: Any, n: int = 10) -> Any:
@@ -431,15 +637,17 @@ def top_changes(totals_df: Any, n: int = 10) -> Any:
             }
         )
 
-    change_rows.sort(
+    top_rows = heapq.nsmallest(
+        n,
+        change_rows,
         key=lambda item: (
-            -float(item["absolute_change"]),
-            str(item["group_type"]).casefold(),
-            str(item["group_name"]).casefold(),
-        )
+            -item["absolute_change"],
+            item["group_type"].casefold(),
+            item["group_name"].casefold(),
+        ),
     )
 
-    return _to_dataframe_or_records(records=change_rows[:n], columns=_TOP_CHANGE_COLUMNS)
+    return _to_dataframe_or_records(records=top_rows, columns=_TOP_CHANGE_COLUMNS)
 
 
 def compute_risk_proxies(exposures_df: Any) -> Any:
@@ -500,6 +708,38 @@ def compute_risk_proxies(exposures_df: Any) -> Any:
     return _to_dataframe_or_records(records=proxy_records, columns=tuple(output_columns))
 
 
+def _concentration_inputs(
+    exposures_df: Any, group_by: list[str]
+) -> tuple[list[tuple[str, ...]], list[float]]:
+    """Return each row's group key and notional as parallel lists.
+
+    pandas DataFrames with a numeric-typed notional column are read column by column;
+    other inputs are resolved row by row.
+    """
+
+    frame = _pandas_frame(exposures_df)
+    if frame is not None and len(frame) and all(col in frame.columns for col in group_by):
+        frame_notionals = _frame_numeric_column(frame, _NOTIONAL_KEYS)
+        if frame_notionals is not None:
+            labels = [[str(value).strip() for value in frame[col].tolist()] for col in group_by]
+            group_keys = list(zip(*labels, strict=True)) if labels else [()] * len(frame)
+            return group_keys, cast(list[float], frame_notionals.tolist())
+
+    rows = _iter_rows(exposures_df, arg_name="exposures_df")
+    if rows:
+        sample = rows[0]
+        missing = [col for col in group_by if col not in sample]
+        if missing:
+            raise ValueError(
+                f"exposures_df is missing required group_by column(s): "
+                f"{', '.join(repr(c) for c in missing)}"
+            )
+
+    group_keys = [tuple(str(row.get(col, "")).strip() for col in group_by) for row in rows]
+    notionals = [_find_numeric(row, _NOTIONAL_KEYS, field="notional") for row in rows]
+    return group_keys, notionals
+
+
 def compute_concentration_metrics(
     exposures_df: Any,
     group_by: list[str] | None = None,
@@ -550,24 +790,13 @@ def compute_concentration_metrics(
     if group_by is None:
         group_by = list(_CONCENTRATION_GROUP_COLUMNS)
 
-    rows = _iter_rows(exposures_df, arg_name="exposures_df")
-
-    if rows:
-        sample = rows[0]
-        missing = [col for col in group_by if col not in sample]
-        if missing:
-            raise ValueError(
-                f"exposures_df is missing required group_by column(s): "
-                f"{', '.join(repr(c) for c in missing)}"
-            )
+    group_keys, notionals = _concentration_inputs(exposures_df, group_by)
 
     groups: dict[tuple[str, ...], list[float]] = defaultdict(list)
     group_key_order: list[tuple[str, ...]] = []
     seen_keys: set[tuple[str, ...]] = set()
 
-    for row in rows:
-        key = tuple(str(row.get(col, "")).strip() for col in group_by)
-        notional = _find_numeric(row, _NOTIONAL_KEYS, field="notional")
+    for key, notional in zip(group_keys, notionals, strict=True):
         if key not in seen_keys:
             group_key_order.append(key)
             seen_keys.add(key)
@@ -575,17 +804,17 @@ def compute_concentration_metrics(
 
     records: list[dict[str, Any]] = []
     for key in group_key_order:
-        notionals = sorted((_exposure_magnitude(value) for value in groups[key]), reverse=True)
-        total = sum(notionals)
+        magnitudes = sorted((_exposure_magnitude(value) for value in groups[key]), reverse=True)
+        total = sum(magnitudes)
 
         if total <= _NEAR_ZERO_EXPOSURE_TOTAL:
             top5_share = 0.0
             top10_share = 0.0
             hhi = 0.0
         else:
-            top5_share = sum(notionals[:5]) / total
-            top10_share = sum(notionals[:10]) / total
-            hhi = sum((n / total) ** 2 for n in notionals)
+            top5_share = sum(magnitudes[:5]) / total
+            top10_share = sum(magnitudes[:10]) / total
+            hhi = sum((n / total) ** 2 for n in magnitudes)
 
         record: dict[str, Any] = {}
         for col, val in zip(group_by, key, strict=False):
@@ -6,24 +6,32 @@ import re
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import date, datetime, tzinfo
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Any
 
 from counter_risk.config import WorkflowConfig
 
-_CPRS_HEADER_DATE_LABELS: tuple[str, ...] = (
-    "cprs ch header date",
-    "cprs-ch header date",
-    "cprs_ch_header_date",
-    "cprs ch as of date",
-    "cprs_ch_as_of_date",
-    "as of date",
-    "as_of_date",
-    "report date",
-    "report_date",
+_CPRS_HEADER_DATE_LABELS: frozenset[str] = frozenset(
+    {
+        "cprs ch header date",
+        "cprs-ch header date",
+        "cprs_ch_header_date",
+        "cprs ch as of date",
+        "cprs_ch_as_of_date",
+        "as of date",
+        "as_of_date",
+        "report date",
+        "report_date",
+    }
 )
 
 _DATE_TOKEN_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}")
+# strptime's own field patterns for "%m/%d/%Y" and "%m/%d/%y", matched once instead of
+# dispatching through _strptime for each format.
+_MDY_DATE_PATTERN = re.compile(
+    r"(1[0-2]|0[1-9]|[1-9])/(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])/(\d\d\d\d|\d\d)"
+)
 
 AS_OF_SOURCE_CONFIG = "config"
 AS_OF_SOURCE_HEADER_MAPPING = "cprs_header_mapping"
@@ -148,7 +156,9 @@ def _infer_as_of_from_cprs_headers(
 
 
 def _extract_date_from_text(text: str) -> tuple[str | None, date | None]:
-    for token in _DATE_TOKEN_PATTERN.findall(text):
+    # finditer stops scanning at the first token that parses instead of listing them all.
+    for match in _DATE_TOKEN_PATTERN.finditer(text):
+        token = match.group()
         parsed = _coerce_date(token)
         if parsed is not None:
             return token, parsed
@@ -168,21 +178,38 @@ def _coerce_date(value: Any) -> date | None:
     stripped = value.strip()
     if not stripped:
         return None
+    return _coerce_date_text(stripped)
+
 
+# Header values repeat across variants and pipeline stages; dates are immutable, so a
+# cached result can be shared safely.
+@lru_cache(maxsize=4096)
+def _coerce_date_text(stripped: str) -> date | None:
     try:
         return date.fromisoformat(stripped)
     except ValueError:
         pass
 
-    for fmt in ("%m/%d/%Y", "%m/%d/%y"):
-        try:
-            return datetime.strptime(stripped, fmt).date()
-        except ValueError:
-            continue
-    return None
+    match = _MDY_DATE_PATTERN.fullmatch(stripped)
+    if match is None:
+        return None
+    month, day, year_text = match.groups()
+    year = int(year_text)
+    if len(year_text) == 2:
+        # strptime's %y pivot: 69-99 -> 1900s, 00-68 -> 2000s.
+        year += 1900 if year >= 69 else 2000
+    try:
+        return date(year, int(month), int(day))
+    except ValueError:
+        return None
 
 
 def _normalize_label(value: Any) -> str:
     if not isinstance(value, str):
         return ""
+    return _normalize_label_text(value)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_label_text(value: str) -> str:
     return " ".join(value.lower().replace("-", " ").split())
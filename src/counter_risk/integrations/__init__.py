@@ -5,6 +5,7 @@ from .powerpoint_com import (
     PowerPointComError,
     PowerPointComInitializationError,
     PowerPointComUnavailableError,
+    PowerPointSession,
     initialize_powerpoint_application,
     is_powerpoint_com_available,
     list_external_link_targets,
@@ -16,6 +17,7 @@ __all__ = [
     "PowerPointComError",
     "PowerPointComInitializationError",
     "PowerPointComUnavailableError",
+    "PowerPointSession",
     "initialize_powerpoint_application",
     "list_external_link_targets",
     "refresh_links_and_save",
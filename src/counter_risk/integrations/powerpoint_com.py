@@ -8,8 +8,9 @@ import os
 import shutil
 import sys
 from contextlib import suppress
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 
 class PowerPointComError(RuntimeError):
@@ -27,6 +28,24 @@ class PowerPointComInitializationError(PowerPointComError):
 MANUAL_LINK_REFRESH_FILENAME = "NEEDS_LINK_REFRESH.txt"
 LOGGER = logging.getLogger(__name__)
 
+_MANUAL_REFRESH_TEMPLATE: Final = """\
+PowerPoint links were not refreshed automatically.
+
+Reason: {reason}
+Input presentation: {source_pptx_path}
+Output presentation: {output_pptx_path}
+
+Manual refresh steps:
+1. Open the output presentation in Microsoft PowerPoint.
+2. Go to File -> Info -> Edit Links to File.
+3. In the Links dialog, click 'Select All'.
+4. Click 'Update Now'.
+5. Confirm every linked item shows an updated status/path.
+6. Save the presentation and close PowerPoint.
+
+Do not distribute this deck until link refresh succeeds.
+"""
+
 
 def _as_path(path: str | Path, *, field_name: str) -> Path:
     resolved = Path(path)
@@ -94,25 +113,10 @@ def _write_manual_refresh_instructions(
     run_folder.mkdir(parents=True, exist_ok=True)
     instructions_path = run_folder / MANUAL_LINK_REFRESH_FILENAME
     instructions_path.write_text(
-        "\n".join(
-            [
-                "PowerPoint links were not refreshed automatically.",
-                "",
-                f"Reason: {reason}",
-                f"Input presentation: {source_pptx_path}",
-                f"Output presentation: {output_pptx_path}",
-                "",
-                "Manual refresh steps:",
-                "1. Open the output presentation in Microsoft PowerPoint.",
-                "2. Go to File -> Info -> Edit Links to File.",
-                "3. In the Links dialog, click 'Select All'.",
-                "4. Click 'Update Now'.",
-                "5. Confirm every linked item shows an updated status/path.",
-                "6. Save the presentation and close PowerPoint.",
-                "",
-                "Do not distribute this deck until link refresh succeeds.",
-                "",
-            ]
+        _MANUAL_REFRESH_TEMPLATE.format(
+            reason=reason,
+            source_pptx_path=source_pptx_path,
+            output_pptx_path=output_pptx_path,
         ),
         encoding="utf-8",
     )
@@ -165,6 +169,26 @@ def _load_dispatch_ex() -> Any:
     return DispatchEx
 
 
+def _prefer_early_binding(app: Any) -> Any:
+    """Return ``app`` wrapped in its gencache (typelib) class when available.
+
+    The generated wrapper resolves members through the type library instead of a
+    ``GetIDsOfNames`` round-trip on every attribute access. Set
+    ``COUNTER_RISK_PPT_COM_LATE_BINDING=1`` to keep the plain late-bound object.
+    """
+
+    if _is_truthy_env("COUNTER_RISK_PPT_COM_LATE_BINDING"):
+        return app
+    try:
+        from win32com.client import gencache
+
+        return gencache.EnsureDispatch(app)
+    except Exception as exc:
+        # gen_py may be unwritable or the typelib unregistered; late binding still works.
+        LOGGER.debug("PowerPoint COM early binding unavailable exc=%s", exc)
+        return app
+
+
 def initialize_powerpoint_application() -> Any:
     """Initialize and return a PowerPoint COM application object.
 
@@ -182,41 +206,103 @@ def initialize_powerpoint_application() -> Any:
             "Failed to initialize PowerPoint COM via DispatchEx('PowerPoint.Application')."
         ) from exc
 
-    return app
+    return _prefer_early_binding(app)
 
 
-def list_external_link_targets(pptx_path: str | Path) -> list[str]:
-    """List external link targets found in a PowerPoint presentation.
+class PowerPointSession:
+    """One PowerPoint instance with one presentation open, shared across operations.
+
+    Launching PowerPoint and loading a deck dominate COM cost, so callers that list
+    and then refresh links on the same presentation should do both in one session::
+
+        with PowerPointSession(pptx_path) as session:
+            targets = session.list_external_link_targets()
+            session.refresh_links_and_save(output_path)
 
     Raises:
         FileNotFoundError: The input file does not exist.
         PowerPointComError: COM initialization/open errors.
     """
 
-    source_path = _as_path(pptx_path, field_name="pptx_path")
-    if not source_path.exists():
-        raise FileNotFoundError(f"Presentation not found: {source_path}")
+    def __init__(self, pptx_path: str | Path, *, read_only: bool = False) -> None:
+        self.source_path = _as_path(pptx_path, field_name="pptx_path")
+        if not self.source_path.exists():
+            raise FileNotFoundError(f"Presentation not found: {self.source_path}")
 
-    app = initialize_powerpoint_application()
-    presentation: Any | None = None
-    targets: list[str] = []
-    try:
-        with suppress(Exception):
-            app.Visible = 0  # Headless/background mode where supported.
-        presentation = app.Presentations.Open(str(source_path), False, True, False)
-        targets.extend(_extract_link_sources(presentation))
+        self.app: Any | None = initialize_powerpoint_application()
+        self.presentation: Any | None = None
+        try:
+            with suppress(Exception):
+                self.app.Visible = 0  # Headless/background mode where supported.
+            self.presentation = self.app.Presentations.Open(
+                str(self.source_path), False, read_only, False
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> PowerPointSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the presentation and quit PowerPoint; safe to call more than once."""
 
+        presentation, self.presentation = self.presentation, None
+        app, self.app = self.app, None
+        try:
+            if presentation is not None:
+                _run_com_cleanup(action="presentation.Close", callback=presentation.Close)
+        finally:
+            if app is not None:
+                _run_com_cleanup(action="app.Quit", callback=app.Quit)
+
+    def _require_presentation(self) -> Any:
+        if self.presentation is None:
+            raise PowerPointComError("PowerPoint session is closed.")
+        return self.presentation
+
+    def list_external_link_targets(self) -> list[str]:
+        """List external link targets found in the open presentation."""
+
+        presentation = self._require_presentation()
+        targets = _extract_link_sources(presentation)
         for shape in _iter_linked_shapes(presentation):
             with suppress(Exception):
                 link_target = str(shape.LinkFormat.SourceFullName)
                 if link_target:
                     targets.append(link_target)
-    finally:
-        if presentation is not None:
-            _run_com_cleanup(action="presentation.Close", callback=presentation.Close)
-        _run_com_cleanup(action="app.Quit", callback=app.Quit)
+        return list(dict.fromkeys(targets))
+
+    def refresh_links_and_save(self, output_pptx_path: str | Path) -> Path:
+        """Refresh external links in the open presentation and save a copy."""
+
+        presentation = self._require_presentation()
+        output_path = _as_path(output_pptx_path, field_name="output_pptx_path")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    return list(dict.fromkeys(targets))
+        with suppress(Exception):
+            presentation.UpdateLinks()
+
+        for shape in _iter_linked_shapes(presentation):
+            _update_shape_links(shape)
+
+        presentation.SaveCopyAs(str(output_path))
+        return output_path
+
+
+def list_external_link_targets(pptx_path: str | Path) -> list[str]:
+    """List external link targets found in a PowerPoint presentation.
+
+    Raises:
+        FileNotFoundError: The input file does not exist.
+        PowerPointComError: COM initialization/open errors.
+    """
+
+    with PowerPointSession(pptx_path, read_only=True) as session:
+        return session.list_external_link_targets()
 
 
 def refresh_links_and_save(
@@ -244,7 +330,7 @@ def refresh_links_and_save(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        app = initialize_powerpoint_application()
+        session = PowerPointSession(source_path)
     except PowerPointComUnavailableError as exc:
         if source_path.resolve() != output_path.resolve():
             shutil.copy2(source_path, output_path)
@@ -256,30 +342,21 @@ def refresh_links_and_save(
         )
         return output_path
 
-    presentation: Any | None = None
-    try:
-        with suppress(Exception):
-            app.Visible = 0  # Headless/background mode where supported.
-        presentation = app.Presentations.Open(str(source_path), False, False, False)
+    with session:
+        return session.refresh_links_and_save(output_path)
 
-        with suppress(Exception):
-            presentation.UpdateLinks()
 
-        for shape in _iter_linked_shapes(presentation):
-            _update_shape_links(shape)
-
-        presentation.SaveCopyAs(str(output_path))
-    finally:
-        if presentation is not None:
-            _run_com_cleanup(action="presentation.Close", callback=presentation.Close)
-        _run_com_cleanup(action="app.Quit", callback=app.Quit)
+def is_powerpoint_com_available() -> bool:
+    """Return ``True`` if PowerPoint COM appears callable on this host.
 
-    return output_path
+    The probe launches PowerPoint, so its result is cached for the life of the process.
+    """
 
+    return _probe_powerpoint_com()
 
-def is_powerpoint_com_available() -> bool:
-    """Return ``True`` if PowerPoint COM appears callable on this host."""
 
+@cache
+def _probe_powerpoint_com() -> bool:
     try:
         app = initialize_powerpoint_application()
     except PowerPointComError:
@@ -296,6 +373,7 @@ __all__ = [
     "PowerPointComError",
     "PowerPointComUnavailableError",
     "PowerPointComInitializationError",
+    "PowerPointSession",
     "initialize_powerpoint_application",
     "list_external_link_targets",
     "refresh_links_and_save",
@@ -4,24 +4,50 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
+
+# json.dumps builds a new encoder on every call once sort_keys is set; reuse one instead.
+_PAYLOAD_ENCODER: Final = json.JSONEncoder(sort_keys=True)
 
 
 class JsonFormatter(logging.Formatter):
     """Format records as JSON objects for deterministic logs."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (whole second, its ISO-8601 text without offset); swapped as one tuple so
+        # handlers on other threads never pair a second with another second's text.
+        self._second_text: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Return ``created`` as UTC ISO-8601, formatting the date part once per second."""
+
+        second = math.floor(created)
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond == 1_000_000:
+            second += 1
+            microsecond = 0
+        cached_second, text = self._second_text
+        if cached_second != second:
+            text = datetime.fromtimestamp(second, tz=UTC).isoformat()[: -len("+00:00")]
+            self._second_text = (second, text)
+        if microsecond:
+            return f"{text}.{microsecond:06d}+00:00"
+        return f"{text}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, sort_keys=True)
+        return _PAYLOAD_ENCODER.encode(payload)
 
 
 def _resolve_level(level: str | int) -> int:
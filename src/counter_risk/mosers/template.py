@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 _TEMPLATE_NAME = "mosers_template.xlsx"
 
 
+@cache
 def get_mosers_template_path() -> Path:
     """Return the filesystem path to the bundled MOSERS workbook template."""
 
@@ -18,21 +21,29 @@ def get_mosers_template_path() -> Path:
     return template_path
 
 
+@cache
 def get_mosers_template_bytes() -> bytes:
-    """Return the raw bytes for the bundled MOSERS workbook template."""
+    """Return the raw bytes for the bundled MOSERS workbook template.
+
+    The template ships with the package and never changes at runtime, so it is read once.
+    """
 
     return get_mosers_template_path().read_bytes()
 
 
 def load_mosers_template_workbook() -> Any:
-    """Load the internal MOSERS template workbook into an editable openpyxl workbook."""
+    """Load the internal MOSERS template workbook into an editable openpyxl workbook.
+
+    Each call parses a fresh workbook from the cached template bytes, so callers may
+    mutate the result freely.
+    """
 
     try:
         from openpyxl import load_workbook
     except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
         raise RuntimeError("openpyxl is required to load MOSERS template workbooks") from exc
 
-    return load_workbook(filename=get_mosers_template_path())
+    return load_workbook(filename=BytesIO(get_mosers_template_bytes()))
 
 
 @dataclass(frozen=True)
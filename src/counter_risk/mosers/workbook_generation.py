@@ -16,10 +16,8 @@ from counter_risk.mosers.template import (
 from counter_risk.parsers.nisa import (
     NisaAllProgramsData,
     NisaTotalsRow,
-    parse_nisa_all_programs,
+    parse_nisa_totals,
 )
-from counter_risk.parsers.nisa_ex_trend import parse_nisa_ex_trend
-from counter_risk.parsers.nisa_trend import parse_nisa_trend
 
 type Workbook = Any
 type Worksheet = Any
@@ -244,7 +242,7 @@ def generate_mosers_workbook(raw_nisa_path: str | Path) -> Workbook:
 
     return _generate_mosers_workbook_from_parser(
         raw_nisa_path,
-        parser=parse_nisa_all_programs,
+        parser=parse_nisa_totals,
         structure=get_mosers_all_programs_output_structure(),
         transformation_scope=get_mosers_all_programs_transformation_scope(),
         variant="all_programs",
@@ -256,7 +254,7 @@ def generate_mosers_workbook_ex_trend(raw_nisa_path: str | Path) -> Workbook:
 
     return _generate_mosers_workbook_from_parser(
         raw_nisa_path,
-        parser=parse_nisa_ex_trend,
+        parser=parse_nisa_totals,
         structure=get_mosers_ex_trend_output_structure(),
         transformation_scope=get_mosers_ex_trend_transformation_scope(),
         variant="ex_trend",
@@ -268,7 +266,7 @@ def generate_mosers_workbook_trend(raw_nisa_path: str | Path) -> Workbook:
 
     return _generate_mosers_workbook_from_parser(
         raw_nisa_path,
-        parser=parse_nisa_trend,
+        parser=parse_nisa_totals,
         structure=get_mosers_trend_output_structure(),
         transformation_scope=get_mosers_trend_transformation_scope(),
         variant="trend",
@@ -373,11 +371,15 @@ def _write_vertical_values(
     values: list[float],
 ) -> None:
     """Write values into a fixed row range and clear remaining cells."""
+
+    from openpyxl.utils.cell import column_index_from_string
+
+    column_number = column_index_from_string(column_letter)
     total_slots = (end_row - start_row) + 1
     for index in range(total_slots):
-        row_number = start_row + index
-        cell = f"{column_letter}{row_number}"
-        worksheet[cell] = values[index] if index < len(values) else None
+        # ``cell(value=None)`` would leave the old value in place, so assign explicitly.
+        cell = worksheet.cell(row=start_row + index, column=column_number)
+        cell.value = values[index] if index < len(values) else None
 
 
 def _write_totals_rows_by_marker(
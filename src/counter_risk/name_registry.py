@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 from counter_risk.name_matching import canonicalize_match_key
 from counter_risk.runtime_paths import resolve_runtime_path
@@ -78,6 +79,9 @@ class NameRegistryEntry(BaseModel):
     display_name: str = Field(min_length=1, max_length=80)
     series_included: SeriesIncludedFlags | None = None
 
+    # Match keys for ``aliases``, computed once so registry-wide checks can reuse them.
+    _alias_tokens: tuple[str, ...] = PrivateAttr(default=())
+
     @field_validator("canonical_key")
     @classmethod
     def _validate_canonical_key(cls, value: str) -> str:
@@ -90,7 +94,6 @@ class NameRegistryEntry(BaseModel):
     @field_validator("aliases")
     @classmethod
     def _validate_aliases(cls, aliases: list[str]) -> list[str]:
-        normalized_seen: set[str] = set()
         normalized_aliases: list[str] = []
 
         for alias in aliases:
@@ -99,12 +102,6 @@ class NameRegistryEntry(BaseModel):
             display_form = " ".join(alias.split())
             if not display_form:
                 raise ValueError("aliases cannot contain blank values.")
-            dedupe_key = _normalize_alias_token(alias)
-            if dedupe_key in normalized_seen:
-                raise ValueError(
-                    f"aliases contains duplicate value after normalization: {display_form!r}"
-                )
-            normalized_seen.add(dedupe_key)
             normalized_aliases.append(display_form)
         return normalized_aliases
 
@@ -116,6 +113,20 @@ class NameRegistryEntry(BaseModel):
             raise ValueError("display_name cannot be blank.")
         return normalized
 
+    @model_validator(mode="after")
+    def _validate_alias_tokens(self) -> NameRegistryEntry:
+        alias_tokens: list[str] = []
+        normalized_seen: set[str] = set()
+
+        for alias in self.aliases:
+            dedupe_key = _normalize_alias_token(alias)
+            if dedupe_key in normalized_seen:
+                raise ValueError(f"aliases contains duplicate value after normalization: {alias!r}")
+            normalized_seen.add(dedupe_key)
+            alias_tokens.append(dedupe_key)
+        self._alias_tokens = tuple(alias_tokens)
+        return self
+
 
 class NameRegistryConfig(BaseModel):
     """Top-level registry schema."""
@@ -135,8 +146,7 @@ class NameRegistryConfig(BaseModel):
                 raise ValueError(f"Duplicate canonical_key found: {entry.canonical_key!r}")
             canonical_keys.add(entry.canonical_key)
 
-            for alias in entry.aliases:
-                alias_token = _normalize_alias_token(alias)
+            for alias, alias_token in zip(entry.aliases, entry._alias_tokens, strict=True):
                 existing = alias_index.get(alias_token)
                 if existing is None:
                     alias_index[alias_token] = entry.canonical_key
@@ -150,7 +160,11 @@ class NameRegistryConfig(BaseModel):
 
 
 def load_name_registry(path: str | Path = Path("config/name_registry.yml")) -> NameRegistryConfig:
-    """Load and validate a name registry YAML file from disk."""
+    """Load and validate a name registry YAML file from disk.
+
+    Unchanged files return the previously validated registry, so treat the
+    result as read-only.
+    """
 
     config_path = Path(path)
     # In a frozen PyInstaller build a relative default like "config/..." is
@@ -158,4 +172,20 @@ def load_name_registry(path: str | Path = Path("config/name_registry.yml")) -> N
     # returns the path unchanged, preserving existing behavior.
     if not config_path.is_absolute() and getattr(sys, "frozen", False):
         config_path = resolve_runtime_path(config_path)
+    try:
+        stat = config_path.stat()
+    except OSError:
+        # Let the YAML loader report the unreadable file with its usual message.
+        return load_yaml_model(config_path, NameRegistryConfig, kind="Name registry")
+    return _load_name_registry_cached(
+        config_path, str(config_path.absolute()), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_name_registry_cached(
+    config_path: Path, absolute_path: str, mtime_ns: int, size: int
+) -> NameRegistryConfig:
+    """Validate a registry file once per (path, mtime, size); callers share the result."""
+    del absolute_path, mtime_ns, size
     return load_yaml_model(config_path, NameRegistryConfig, kind="Name registry")
@@ -135,7 +135,11 @@ def _as_date(value: Any) -> date | None:
 
 
 def _text(value: Any) -> str:
-    return " ".join(str(value or "").split()).strip()
+    # Empty cells are the common case while scanning; str.split() already drops
+    # leading/trailing whitespace, so no trailing strip() is needed.
+    if not value:
+        return ""
+    return " ".join(str(value).split())
 
 
 def _normalize_text(value: Any) -> str:
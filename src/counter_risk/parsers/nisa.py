@@ -145,6 +145,21 @@ def get_nisa_all_programs_input_structure() -> NisaAllProgramsInputStructure:
 def parse_nisa_all_programs(path: Path | str) -> NisaAllProgramsData:
     """Parse raw NISA workbook into deterministic CH and totals row sets."""
 
+    return _parse_nisa_workbook(path, ch_row_limit=None)
+
+
+def parse_nisa_totals(path: Path | str) -> NisaAllProgramsData:
+    """Parse every totals row but only the first CPRS-CH row of a raw NISA workbook.
+
+    MOSERS workbook generation reads nothing from the CH section beyond the first
+    program name, so later CH rows are validated but not returned. Validation
+    otherwise matches :func:`parse_nisa_all_programs`.
+    """
+
+    return _parse_nisa_workbook(path, ch_row_limit=1)
+
+
+def _parse_nisa_workbook(path: Path | str, *, ch_row_limit: int | None) -> NisaAllProgramsData:
     workbook_path = Path(path)
     if not workbook_path.exists():
         raise FileNotFoundError(f"NISA raw workbook not found: {workbook_path}")
@@ -175,6 +190,7 @@ def parse_nisa_all_programs(path: Path | str) -> NisaAllProgramsData:
             totals_marker_row=totals_marker_row,
             header_row=header_row,
             header_columns=header_columns,
+            limit=ch_row_limit,
         )
         totals_rows = _parse_totals_rows(
             worksheet=worksheet,
@@ -328,6 +344,7 @@ def _parse_ch_rows(
     totals_marker_row: int,
     header_row: int,
     header_columns: dict[str, int],
+    limit: int | None = None,
 ) -> list[NisaChRow]:
     rows: list[NisaChRow] = []
     current_segment = ""
@@ -354,41 +371,14 @@ def _parse_ch_rows(
         if not current_segment:
             continue
 
-        rows.append(
-            NisaChRow(
-                segment=current_segment,
-                counterparty=counterparty,
-                cash=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["cash"]).value
-                ),
-                tips=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["tips"]).value
-                ),
-                treasury=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["treasury"]).value
-                ),
-                equity=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["equity"]).value
-                ),
-                commodity=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["commodity"]).value
-                ),
-                currency=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["currency"]).value
-                ),
-                notional=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["notional"]).value
-                ),
-                notional_change=_coerce_float(
-                    worksheet.cell(row=row_number, column=header_columns["notional_change"]).value
-                ),
-                annualized_volatility=_coerce_float(
-                    worksheet.cell(
-                        row=row_number, column=header_columns["annualized_volatility"]
-                    ).value
-                ),
-            )
-        )
+        metrics = {
+            field: _coerce_float(worksheet.cell(row=row_number, column=header_columns[field]).value)
+            for field in _REQUIRED_HEADERS
+        }
+        # Rows past the limit are still coerced above so bad numbers are rejected.
+        if limit is not None and len(rows) >= limit:
+            continue
+        rows.append(NisaChRow(segment=current_segment, counterparty=counterparty, **metrics))
 
     return rows
 
@@ -480,4 +470,5 @@ __all__ = [
     "NisaTotalsRow",
     "get_nisa_all_programs_input_structure",
     "parse_nisa_all_programs",
+    "parse_nisa_totals",
 ]
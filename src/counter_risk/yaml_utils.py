@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 import yaml
 from pydantic import BaseModel, ValidationError
 
+# libyaml-backed loader when PyYAML was built with it; same safe tag set, parsed in C.
+_SafeLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class _NoDuplicateSafeLoader(yaml.SafeLoader):
+
+class _NoDuplicateSafeLoader(_SafeLoader):  # type: ignore[misc,valid-type]
     """Safe YAML loader that rejects duplicate keys in mappings."""
 
 
@@ -39,6 +44,18 @@ def _format_yaml_validation_error(error: ValidationError, kind: str) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int, reject_duplicate_keys: bool) -> Any:
+    """Parse a YAML file; cached on (path, mtime, size) so unchanged files are read once."""
+    del mtime_ns, size
+    loader_cls: Any = _NoDuplicateSafeLoader if reject_duplicate_keys else _SafeLoader
+    loader = loader_cls(Path(path).read_text(encoding="utf-8"))
+    try:
+        return loader.get_single_data()
+    finally:
+        cast(Any, loader).dispose()
+
+
 def load_yaml_model[M: BaseModel](
     path: str | Path,
     model_cls: type[M],
@@ -48,15 +65,11 @@ def load_yaml_model[M: BaseModel](
 ) -> M:
     """Load a YAML file and validate it against a Pydantic model."""
     config_path = Path(path)
-    loader_cls: type[yaml.SafeLoader] = (
-        _NoDuplicateSafeLoader if reject_duplicate_keys else yaml.SafeLoader
-    )
     try:
-        loader = loader_cls(config_path.read_text(encoding="utf-8"))
-        try:
-            raw = loader.get_single_data()
-        finally:
-            cast(Any, loader).dispose()
+        stat = config_path.stat()
+        raw = _parse_yaml_file(
+            str(config_path.absolute()), stat.st_mtime_ns, stat.st_size, reject_duplicate_keys
+        )
     except OSError as exc:
         raise ValueError(f"Unable to read {kind} file '{config_path}': {exc}") from exc
     except ValueError as exc:
@@ -64,7 +77,8 @@ def load_yaml_model[M: BaseModel](
     except yaml.YAMLError as exc:
         raise ValueError(f"Invalid YAML in {kind} file '{config_path}': {exc}") from exc
 
-    data: Any = raw if raw is not None else {}
+    # Callers get a private copy so mutating the result never leaks into the cache.
+    data: Any = copy.deepcopy(raw) if raw is not None else {}
     if not isinstance(data, dict):
         raise ValueError(f"{kind} file '{config_path}' must contain a top-level mapping/object.")
 
@@ -243,6 +243,25 @@ def test_custom_group_by_columns() -> None:
     assert keys == {("X", "east"), ("X", "west")}
 
 
+def test_dataframe_input_matches_row_records() -> None:
+    """DataFrame input yields the same metrics as the equivalent row mappings."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        {
+            "variant": ["v1", " v1", "v2", "v2"],
+            "segment": [1, 1, 2, 2],
+            "counterparty": ["A", "B", "C", "D"],
+            "exposure": [60, -40, 10, 30],
+        }
+    )
+
+    from_frame = _as_records(compute_concentration_metrics(frame))
+    from_rows = _as_records(compute_concentration_metrics(frame.to_dict(orient="records")))
+
+    assert repr(from_frame) == repr(from_rows)
+    assert [(r["variant"], r["segment"]) for r in from_frame] == [("v1", "1"), ("v2", "2")]
+
+
 # ---------------------------------------------------------------------------
 # Edge cases
 # ---------------------------------------------------------------------------
@@ -110,6 +110,21 @@ def test_compute_notional_breakdown_single_asset_class() -> None:
     assert breakdown == {"Cash": 1.0}
 
 
+def test_compute_notional_breakdown_dataframe_input_matches_row_records() -> None:
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        {
+            "segment": ["Cash ", "equity", "Cash", "Treasury"],
+            "notional": [0.1, 0.2, 0.7, 0.3],
+        }
+    )
+
+    assert compute_notional_breakdown(frame) == compute_notional_breakdown(
+        frame.to_dict(orient="records")
+    )
+    assert list(compute_notional_breakdown(frame)) == ["Cash", "equity", "Treasury"]
+
+
 def test_compute_totals_aggregates_counterparty_and_asset_class() -> None:
     exposures = [
         {
@@ -150,6 +165,35 @@ def test_compute_totals_aggregates_counterparty_and_asset_class() -> None:
     }
 
 
+@pytest.mark.parametrize(
+    "exposures",
+    [
+        {
+            "counterparty": [" b", "A", "B", "a"],
+            "class": ["Cash", "Equity", "Cash", "Cash"],
+            "exposure": [0.1, 0.2, 0.7, -0.0],
+            "prior": [0.3, float("nan"), 0.1, 0.0],
+        },
+        {
+            "counterparty": ["A", None, "B", "A"],
+            "counterparty_name": ["x", "C", "y", "z"],
+            "asset_class": ["Cash", "Cash", "Equity", "Cash"],
+            "notional": [1, 2, 3, 4],
+        },
+    ],
+)
+def test_compute_totals_dataframe_input_matches_row_records(
+    exposures: dict[str, list[Any]],
+) -> None:
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(exposures)
+
+    from_frame = _as_records(compute_totals(frame))
+    from_rows = _as_records(compute_totals(frame.to_dict(orient="records")))
+
+    assert repr(from_frame) == repr(from_rows)
+
+
 def test_apply_repo_cash_to_totals_updates_existing_and_appends_new_counterparty() -> None:
     totals_rows = [
         {
@@ -234,6 +278,23 @@ def test_top_exposures_is_deterministic_for_ties() -> None:
     assert [row["counterparty"] for row in first] == ["Alpha", "Bravo", "Charlie"]
 
 
+def test_top_exposures_dataframe_input_matches_row_records() -> None:
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        {
+            "name": [" Bravo", "alpha", "Alpha", "Charlie"],
+            "segment": ["Equity", "Cash", "Cash", "Equity"],
+            "exposure": [-100, 100, 100, 50],
+        }
+    )
+
+    from_frame = _as_records(top_exposures(frame, n=3))
+    from_rows = _as_records(top_exposures(frame.to_dict(orient="records"), n=3))
+
+    assert repr(from_frame) == repr(from_rows)
+    assert [row["counterparty"] for row in from_frame] == ["alpha", "Alpha", "Bravo"]
+
+
 def test_top_exposures_is_deterministic_for_fixture_input() -> None:
     pytest.importorskip("pandas")
     totals = parse_fcm_totals(
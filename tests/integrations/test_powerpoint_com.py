@@ -14,6 +14,11 @@ import pytest
 from counter_risk.integrations import powerpoint_com
 
 
+@pytest.fixture(autouse=True)
+def _clear_com_availability_cache() -> None:
+    powerpoint_com._probe_powerpoint_com.cache_clear()
+
+
 def test_is_powerpoint_com_available_false_on_non_windows(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(sys, "platform", "linux")
 
@@ -63,6 +68,26 @@ def test_is_powerpoint_com_available_true_when_dispatch_works(
     assert app.quit_called is True
 
 
+def test_is_powerpoint_com_available_probes_once_per_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probes: list[int] = []
+
+    class FakeApp:
+        def Quit(self) -> None:  # noqa: N802
+            return None
+
+    def fake_initialize() -> FakeApp:
+        probes.append(1)
+        return FakeApp()
+
+    monkeypatch.setattr(powerpoint_com, "initialize_powerpoint_application", fake_initialize)
+
+    assert powerpoint_com.is_powerpoint_com_available() is True
+    assert powerpoint_com.is_powerpoint_com_available() is True
+    assert len(probes) == 1
+
+
 def test_initialize_powerpoint_application_raises_unavailable_on_non_windows() -> None:
     with pytest.raises(powerpoint_com.PowerPointComUnavailableError):
         powerpoint_com._load_dispatch_ex()
@@ -82,6 +107,46 @@ def test_initialize_powerpoint_application_wraps_dispatch_errors(
     assert isinstance(exc_info.value.__cause__, RuntimeError)
 
 
+def test_initialize_powerpoint_application_prefers_early_bound_wrapper(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    late_bound = object()
+    early_bound = object()
+    gencache_mod = types.ModuleType("win32com.client.gencache")
+    gencache_mod.EnsureDispatch = (  # type: ignore[attr-defined]
+        lambda app: early_bound if app is late_bound else None
+    )
+    client_mod = types.ModuleType("win32com.client")
+    client_mod.gencache = gencache_mod  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "win32com.client", client_mod)
+    monkeypatch.setitem(sys.modules, "win32com.client.gencache", gencache_mod)
+    monkeypatch.setattr(powerpoint_com, "_load_dispatch_ex", lambda: lambda _: late_bound)
+
+    assert powerpoint_com.initialize_powerpoint_application() is early_bound
+
+    monkeypatch.setenv("COUNTER_RISK_PPT_COM_LATE_BINDING", "1")
+    assert powerpoint_com.initialize_powerpoint_application() is late_bound
+
+
+def test_initialize_powerpoint_application_falls_back_when_gencache_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    late_bound = object()
+
+    def failing_ensure_dispatch(_: Any) -> Any:
+        raise PermissionError("gen_py is read-only")
+
+    gencache_mod = types.ModuleType("win32com.client.gencache")
+    gencache_mod.EnsureDispatch = failing_ensure_dispatch  # type: ignore[attr-defined]
+    client_mod = types.ModuleType("win32com.client")
+    client_mod.gencache = gencache_mod  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "win32com.client", client_mod)
+    monkeypatch.setitem(sys.modules, "win32com.client.gencache", gencache_mod)
+    monkeypatch.setattr(powerpoint_com, "_load_dispatch_ex", lambda: lambda _: late_bound)
+
+    assert powerpoint_com.initialize_powerpoint_application() is late_bound
+
+
 def test_refresh_links_and_save_writes_manual_instructions_when_com_unavailable(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -359,3 +424,118 @@ def test_list_external_link_targets_collects_presentation_and_shape_sources(
     assert app.Presentations.open_args == [(str(source_pptx), False, True, False)]
     assert presentation.close_calls == 1
     assert app.quit_calls == 1
+
+
+def test_powerpoint_session_lists_and_refreshes_with_one_launch(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    class FakeLinkFormat:
+        def __init__(self, source: str) -> None:
+            self.SourceFullName = source
+            self.update_calls = 0
+
+        def Update(self) -> None:  # noqa: N802
+            self.update_calls += 1
+
+    class FakeShape:
+        def __init__(self, source: str) -> None:
+            self.LinkFormat = FakeLinkFormat(source)
+            self.GroupItems: list[FakeShape] = []
+
+    class FakeSlide:
+        def __init__(self, shapes: list[FakeShape]) -> None:
+            self.Shapes = shapes
+
+    class FakePresentation:
+        def __init__(self) -> None:
+            self.Slides = [FakeSlide([FakeShape("X:\\linked\\book1.xlsx")])]
+            self.save_copy_paths: list[str] = []
+            self.close_calls = 0
+
+        def LinkSources(self) -> list[str]:  # noqa: N802
+            return ["X:\\linked\\book1.xlsx"]
+
+        def UpdateLinks(self) -> None:  # noqa: N802
+            return None
+
+        def SaveCopyAs(self, path: str) -> None:  # noqa: N802
+            self.save_copy_paths.append(path)
+
+        def Close(self) -> None:  # noqa: N802
+            self.close_calls += 1
+
+    class FakePresentations:
+        def __init__(self, presentation: FakePresentation) -> None:
+            self.presentation = presentation
+            self.open_args: list[tuple[str, bool, bool, bool]] = []
+
+        def Open(  # noqa: N802
+            self, path: str, with_window: bool, read_only: bool, untitled: bool
+        ) -> FakePresentation:
+            self.open_args.append((path, with_window, read_only, untitled))
+            return self.presentation
+
+    class FakeApp:
+        def __init__(self, presentation: FakePresentation) -> None:
+            self.Presentations = FakePresentations(presentation)
+            self.Visible: int | None = None
+            self.quit_calls = 0
+
+        def Quit(self) -> None:  # noqa: N802
+            self.quit_calls += 1
+
+    source_pptx = tmp_path / "in.pptx"
+    output_pptx = tmp_path / "nested" / "out.pptx"
+    source_pptx.write_bytes(b"stub")
+
+    presentation = FakePresentation()
+    apps: list[FakeApp] = []
+
+    def fake_initialize() -> FakeApp:
+        apps.append(FakeApp(presentation))
+        return apps[-1]
+
+    monkeypatch.setattr(powerpoint_com, "initialize_powerpoint_application", fake_initialize)
+
+    with powerpoint_com.PowerPointSession(source_pptx) as session:
+        targets = session.list_external_link_targets()
+        returned = session.refresh_links_and_save(output_pptx)
+
+    assert targets == ["X:\\linked\\book1.xlsx"]
+    assert returned == output_pptx
+    assert output_pptx.parent.is_dir()
+    assert presentation.save_copy_paths == [str(output_pptx)]
+    assert len(apps) == 1
+    assert apps[0].Presentations.open_args == [(str(source_pptx), False, False, False)]
+    assert presentation.close_calls == 1
+    assert apps[0].quit_calls == 1
+    with pytest.raises(powerpoint_com.PowerPointComError, match="session is closed"):
+        session.list_external_link_targets()
+
+
+def test_powerpoint_session_quits_app_when_open_fails(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    class FakePresentations:
+        def Open(self, *_args: object) -> None:  # noqa: N802
+            raise RuntimeError("open failed")
+
+    class FakeApp:
+        def __init__(self) -> None:
+            self.Presentations = FakePresentations()
+            self.quit_calls = 0
+
+        def Quit(self) -> None:  # noqa: N802
+            self.quit_calls += 1
+
+    source_pptx = tmp_path / "in.pptx"
+    source_pptx.write_bytes(b"stub")
+    app = FakeApp()
+    monkeypatch.setattr(powerpoint_com, "initialize_powerpoint_application", lambda: app)
+
+    with pytest.raises(RuntimeError, match="open failed"):
+        powerpoint_com.PowerPointSession(source_pptx)
+
+    assert app.quit_calls == 1
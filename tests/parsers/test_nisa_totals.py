@@ -0,0 +1,43 @@
+"""Tests for the totals-only raw NISA parser used by MOSERS generation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from counter_risk.parsers.nisa import parse_nisa_all_programs, parse_nisa_totals
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "raw_nisa_all_programs.xlsx",
+        pytest.param("NISA Monthly All Programs - Raw.xlsx", marks=pytest.mark.slow),
+        pytest.param("NISA Monthly Ex Trend - Raw.xlsx", marks=pytest.mark.slow),
+        pytest.param("NISA Monthly Trend - Raw.xlsx", marks=pytest.mark.slow),
+    ],
+)
+def test_parse_nisa_totals_matches_full_parse(fixture_name: str) -> None:
+    fixture_path = Path("tests/fixtures") / fixture_name
+
+    full = parse_nisa_all_programs(fixture_path)
+    totals = parse_nisa_totals(fixture_path)
+
+    assert totals.totals_rows == full.totals_rows
+    assert totals.ch_rows == full.ch_rows[:1]
+
+
+def test_parse_nisa_totals_rejects_invalid_number_in_later_ch_row(tmp_path: Path) -> None:
+    workbook = load_workbook(Path("tests/fixtures/raw_nisa_all_programs.xlsx"))
+    worksheet = workbook["Raw Data"]
+    assert worksheet["B8"].value == "Beta Bank"
+    worksheet["D8"] = "not-a-number"
+    broken_path = tmp_path / "broken_nisa.xlsx"
+    workbook.save(broken_path)
+
+    with pytest.raises(ValueError):
+        parse_nisa_all_programs(broken_path)
+    with pytest.raises(ValueError):
+        parse_nisa_totals(broken_path)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from builtins import __import__ as _builtin_import
 from pathlib import Path
@@ -14,6 +15,7 @@ from counter_risk.chat.context import (
     RunContextError,
     _load_parquet_table,
     discover_tables,
+    iter_table_rows,
     load_chat_logs,
     load_manifest,
     load_run_context,
@@ -65,6 +67,29 @@ def test_load_run_context_returns_non_empty_summary(tmp_path: Path) -> None:
     assert context.summary().strip() != ""
 
 
+def test_load_run_context_reuses_tables_until_manifest_changes(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    chat_dir = run_dir / "chat_logs"
+    chat_dir.mkdir(parents=True)
+    manifest_path = run_dir / "manifest.json"
+    manifest_path.write_text(json.dumps({"warnings": ["first"]}), encoding="utf-8")
+    (run_dir / "totals.csv").write_text("counterparty\nA\n", encoding="utf-8")
+
+    first = load_run_context(run_dir)
+    (chat_dir / "chat_log.jsonl").write_text(json.dumps({"interaction": 1}) + "\n", "utf-8")
+    second = load_run_context(run_dir)
+
+    assert second.tables is first.tables
+    assert second.chat_logs == [{"interaction": 1}]
+
+    manifest_path.write_text(json.dumps({"warnings": ["second"]}), encoding="utf-8")
+    os.utime(manifest_path, ns=(0, manifest_path.stat().st_mtime_ns + 1_000_000))
+    third = load_run_context(run_dir)
+
+    assert third.warnings == ["second"]
+    assert third.tables is not first.tables
+
+
 def test_load_manifest_missing_raises_error(tmp_path: Path) -> None:
     run_dir = tmp_path / "run"
     run_dir.mkdir()
@@ -94,14 +119,44 @@ def test_discover_tables_loads_csv_and_parquet(
 
     monkeypatch.setattr(
         "counter_risk.chat.context._load_parquet_table",
-        lambda _: [{"counterparty": "B", "notional": 2.0}],
+        lambda _: {"counterparty": ["B"], "notional": [2.0]},
     )
 
     tables = discover_tables(run_dir)
 
-    assert "totals.csv" in tables
+    assert tables["totals.csv"] == {"counterparty": ["A"], "Notional": ["1"]}
     assert "nested/futures.parquet" in tables
-    assert tables["nested/futures.parquet"][0]["counterparty"] == "B"
+    assert tables["nested/futures.parquet"]["counterparty"] == ["B"]
+
+
+def test_discover_tables_reads_short_csv_rows_as_none(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    (run_dir / "totals.csv").write_text("counterparty,Notional\nA,1\n\nB\n", encoding="utf-8")
+
+    table = discover_tables(run_dir)["totals.csv"]
+
+    assert table == {"counterparty": ["A", "B"], "Notional": ["1", None]}
+    assert list(iter_table_rows(table)) == [
+        {"counterparty": "A", "Notional": "1"},
+        {"counterparty": "B", "Notional": None},
+    ]
+
+
+@pytest.mark.parametrize("workers", ["1", "4", "not-a-number"])
+def test_discover_tables_returns_sorted_tables_for_any_worker_count(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: str
+) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for name in ("c.csv", "a.csv", "b.csv"):
+        (run_dir / name).write_text(f"counterparty\n{name}\n", encoding="utf-8")
+    monkeypatch.setenv("COUNTER_RISK_CHAT_IO_WORKERS", workers)
+
+    tables = discover_tables(run_dir)
+
+    assert list(tables) == ["a.csv", "b.csv", "c.csv"]
+    assert tables["b.csv"] == {"counterparty": ["b.csv"]}
 
 
 def test_load_parquet_table_parse_error_message(
@@ -117,6 +172,7 @@ def test_load_parquet_table_parse_error_message(
         errors=SimpleNamespace(ParserError=FakeParserError, EmptyDataError=FakeParserError),
         read_parquet=lambda _: (_ for _ in ()).throw(FakeParserError("not parquet")),
     )
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
     monkeypatch.setitem(sys.modules, "pandas", fake_pd)
 
     with pytest.raises(RunContextError, match="Parquet data format error") as exc_info:
@@ -139,6 +195,7 @@ def test_load_parquet_table_pyarrow_io_error_message(
             context_module._PYARROW_IO_ERROR_TYPES[0]("io fail")
         ),
     )
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
     monkeypatch.setitem(sys.modules, "pandas", fake_pd)
 
     with pytest.raises(RunContextError, match="PyArrow could not access Parquet table") as exc_info:
@@ -154,8 +211,8 @@ def test_load_parquet_table_missing_pandas_mentions_pip_install_dot(
     parquet_path.write_bytes(b"broken")
 
     def fake_import(name: str, *args: object, **kwargs: object) -> object:
-        if name == "pandas":
-            raise ModuleNotFoundError("No module named 'pandas'")
+        if name in {"pandas", "pyarrow.parquet"}:
+            raise ModuleNotFoundError(f"No module named '{name}'")
         return _builtin_import(name, *args, **kwargs)
 
     monkeypatch.setattr("builtins.__import__", fake_import)
@@ -168,6 +225,34 @@ def test_load_parquet_table_missing_pandas_mentions_pip_install_dot(
     assert ".[pandas]" not in message
 
 
+def test_load_parquet_table_reads_records_with_pyarrow(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    parquet_path = tmp_path / "futures.parquet"
+    pq.write_table(pa.table({"counterparty": ["A", "B"], "notional": [1.5, None]}), parquet_path)
+
+    assert _load_parquet_table(parquet_path) == {
+        "counterparty": ["A", "B"],
+        "notional": [1.5, None],
+    }
+
+
+def test_load_parquet_table_projects_onto_known_columns(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    projected_path = tmp_path / "projected.parquet"
+    pq.write_table(
+        pa.table({"Counterparty": ["A"], "internal_id": [7], "notional": [1.0]}), projected_path
+    )
+    unknown_path = tmp_path / "unknown.parquet"
+    pq.write_table(pa.table({"internal_id": [7]}), unknown_path)
+
+    assert _load_parquet_table(projected_path) == {"Counterparty": ["A"], "notional": [1.0]}
+    assert _load_parquet_table(unknown_path) == {"internal_id": [7]}
+
+
 def test_load_chat_logs_returns_empty_when_directory_missing(tmp_path: Path) -> None:
     run_dir = tmp_path / "run"
     run_dir.mkdir()
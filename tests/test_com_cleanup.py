@@ -7,6 +7,11 @@ import pytest
 from counter_risk.integrations import powerpoint_com
 
 
+@pytest.fixture(autouse=True)
+def _clear_com_availability_cache() -> None:
+    powerpoint_com._probe_powerpoint_com.cache_clear()
+
+
 def test_refresh_links_cleanup_failures_are_logged_not_silently_suppressed(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
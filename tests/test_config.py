@@ -544,3 +544,27 @@ def test_load_config_rejects_duplicate_top_level_keys(tmp_path: Path) -> None:
     )
     with pytest.raises(ValueError, match="duplicate key"):
         load_config(config_path)
+
+
+def test_load_config_reparses_only_after_file_changes(tmp_path: Path) -> None:
+    from counter_risk import yaml_utils
+
+    source = Path("config/all_programs.yml").read_text(encoding="utf-8")
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(source, encoding="utf-8")
+    yaml_utils._parse_yaml_file.cache_clear()
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+
+    assert yaml_utils._parse_yaml_file.cache_info().hits == 1
+    assert first is not second
+
+    config_path.write_text(
+        source.replace("output_root: runs/all_programs", "output_root: runs/changed"),
+        encoding="utf-8",
+    )
+    third = load_config(config_path)
+
+    assert yaml_utils._parse_yaml_file.cache_info().misses == 2
+    assert third.output_root == Path("runs/changed")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -41,6 +42,26 @@ def test_json_formatter_emits_expected_keys() -> None:
     assert "timestamp" in payload
 
 
+@pytest.mark.parametrize("created", [1_767_225_600.0, 1_767_225_600.25, 1_767_225_601.999_999_6])
+def test_json_formatter_timestamp_matches_record_creation_time(created: float) -> None:
+    formatter = cr_logging.JsonFormatter()
+    record = logging.LogRecord(
+        name="counter_risk.tests",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="hello",
+        args=(),
+        exc_info=None,
+    )
+    record.created = created
+
+    first = json.loads(formatter.format(record))["timestamp"]
+    second = json.loads(formatter.format(record))["timestamp"]
+
+    assert first == second == datetime.fromtimestamp(created, tz=UTC).isoformat()
+
+
 def test_json_formatter_includes_exception_text() -> None:
     formatter = cr_logging.JsonFormatter()
     try:
@@ -64,6 +64,47 @@ def test_derive_as_of_date_uses_cprs_header_text_tokens_when_config_missing() ->
     assert derived == date(2026, 1, 31)
 
 
+@pytest.mark.parametrize(
+    ("header_value", "expected"),
+    [
+        ("1/5/2026", date(2026, 1, 5)),
+        ("01/31/26", date(2026, 1, 31)),
+        ("12/31/69", date(1969, 12, 31)),
+        ("2/ 5/2026", date(2026, 2, 5)),
+        ("02/29/2025", None),
+        ("13/01/2026", None),
+        ("1/5/202", None),
+    ],
+)
+def test_resolve_as_of_date_parses_month_day_year_header_values(
+    header_value: str, expected: date | None
+) -> None:
+    config = _config(as_of_date=None)
+    headers = {"As Of Date": header_value}
+
+    if expected is None:
+        with pytest.raises(ValueError, match="Unable to derive as_of_date"):
+            resolve_as_of_date(config, headers)
+    else:
+        assert resolve_as_of_date(config, headers).value == expected
+
+
+@pytest.mark.parametrize(
+    "label",
+    ["CPRS CH Header Date", "cprs_ch_as_of_date", "Report-Date", "  As   Of  Date "],
+)
+def test_resolve_as_of_date_matches_known_header_labels(label: str) -> None:
+    resolution = resolve_as_of_date(_config(as_of_date=None), {label: "2026-01-31"})
+
+    assert resolution.value == date(2026, 1, 31)
+    assert resolution.details["header_label"] == label
+
+
+def test_resolve_as_of_date_ignores_unknown_header_labels() -> None:
+    with pytest.raises(ValueError, match="Unable to derive as_of_date"):
+        resolve_as_of_date(_config(as_of_date=None), {"Settlement Date": "2026-01-31"})
+
+
 def test_derive_as_of_date_raises_clear_error_when_no_valid_source() -> None:
     config = _config(as_of_date=None)
 
@@ -368,3 +368,27 @@ def test_load_name_registry_rejects_duplicate_top_level_keys(tmp_path: Path) ->
     )
     with pytest.raises(ValueError, match="duplicate key"):
         load_name_registry(config_path)
+
+
+def test_load_name_registry_revalidates_only_after_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "name_registry.yml"
+    template = (
+        "schema_version: 1\n"
+        "entries:\n"
+        "  - canonical_key: sample_name\n"
+        "    display_name: {display_name}\n"
+        "    aliases:\n"
+        "      - Sample Name\n"
+    )
+    config_path.write_text(template.format(display_name="Sample Name"), encoding="utf-8")
+
+    first = load_name_registry(config_path)
+    second = load_name_registry(config_path)
+
+    assert second is first
+
+    config_path.write_text(template.format(display_name="Sample Name Updated"), encoding="utf-8")
+    third = load_name_registry(config_path)
+
+    assert third is not first
+    assert third.entries[0].display_name == "Sample Name Updated"
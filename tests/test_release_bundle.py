@@ -143,6 +143,9 @@ def test_create_runner_file_directly_invokes_packaged_executable_only(tmp_path:
     assert '"%EXE_PATH%" %*' in runner_text
     assert "counter-risk.exe" in runner_text
     assert "counter-risk" in runner_text
+    runner_bytes = runner_path.read_bytes()
+    assert runner_bytes.endswith(b"\r\n")
+    assert runner_bytes.count(b"\n") == runner_bytes.count(b"\r\n")
 
 
 def test_assemble_release_requires_force_for_existing_bundle(
@@ -167,6 +170,81 @@ def test_assemble_release_requires_force_for_existing_bundle(
         release.assemble_release("1.0.0", output_dir)
 
 
+def test_assemble_release_force_refreshes_existing_bundle_in_place(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo_root = tmp_path / "repo"
+    _write_fake_repo(repo_root)
+    output_dir = tmp_path / "release"
+
+    monkeypatch.setattr(release, "repository_root", lambda: repo_root)
+    monkeypatch.setattr(
+        release,
+        "_run_pyinstaller",
+        lambda root, spec_path: _create_fake_built_executable(
+            root, release._executable_filename(for_windows=False)
+        ),
+    )
+
+    bundle_dir = release.assemble_release("1.0.0", output_dir)
+    copied_fixture = bundle_dir / "fixtures" / "fixture.xlsx"
+    copied_config = bundle_dir / "config" / "fixture_replay.yml"
+    # Mark the untouched copy so a re-copy would be detectable.
+    os.utime(copied_fixture, ns=(0, copied_fixture.stat().st_mtime_ns))
+    stale_file = bundle_dir / "fixtures" / "stale" / "old.csv"
+    stale_file.parent.mkdir(parents=True)
+    stale_file.write_text("stale\n", encoding="utf-8")
+    (repo_root / "config" / "fixture_replay.yml").write_text("name: updated\n", encoding="utf-8")
+
+    release.assemble_release("1.0.0", output_dir, force=True)
+
+    assert copied_fixture.stat().st_atime_ns == 0
+    assert copied_config.read_text(encoding="utf-8") == "name: updated\n"
+    assert not stale_file.exists()
+    assert not stale_file.parent.exists()
+    manifest = json.loads((bundle_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["artifacts"]["fixtures"] == ["fixtures/fixture.pptx", "fixtures/fixture.xlsx"]
+
+
+def test_assemble_release_reuses_cached_executable_until_inputs_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo_root = tmp_path / "repo"
+    _write_fake_repo(repo_root)
+    output_dir = tmp_path / "release"
+    calls: list[Path] = []
+
+    def _fake_run_pyinstaller(root: Path, spec_path: Path) -> None:
+        calls.append(spec_path)
+        _create_fake_built_executable(root, release._executable_filename(for_windows=False))
+
+    monkeypatch.setattr(release, "repository_root", lambda: repo_root)
+    monkeypatch.setattr(release, "_run_pyinstaller", _fake_run_pyinstaller)
+    (repo_root / "requirements.lock").write_text("openpyxl==3.1.5\n", encoding="utf-8")
+
+    release.assemble_release("1.0.0", output_dir)
+    bundle_dir = release.assemble_release("1.0.0", output_dir, force=True)
+
+    assert len(calls) == 1
+    assert (bundle_dir / "bin" / "counter-risk").read_bytes() == b"fake-binary"
+
+    (repo_root / "release.spec").write_text("# changed\n", encoding="utf-8")
+    release.assemble_release("1.0.0", output_dir, force=True)
+
+    assert len(calls) == 2
+    assert len(list((repo_root / "dist" / "_pyinstaller_cache").iterdir())) == 1
+
+    (repo_root / "requirements.lock").write_text("openpyxl==99.0.0\n", encoding="utf-8")
+    release.assemble_release("1.0.0", output_dir, force=True)
+
+    assert len(calls) == 3
+
+    monkeypatch.setattr(release, "_pyinstaller_version", lambda: "99.0")
+    release.assemble_release("1.0.0", output_dir, force=True)
+
+    assert len(calls) == 4
+
+
 def test_main_accepts_version_and_output_dir(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -269,6 +347,23 @@ def test_assemble_release_fails_on_duplicate_template_filenames(
     assert str(expected_fixture_path) in message
 
 
+class _FakePopen:
+    """Minimal ``subprocess.Popen`` stand-in that replays fixed combined output."""
+
+    def __init__(self, output: str, returncode: int) -> None:
+        self.stdout = io.StringIO(output)
+        self.returncode = returncode
+
+    def __enter__(self) -> _FakePopen:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stdout.close()
+
+    def wait(self) -> int:
+        return self.returncode
+
+
 def test_run_pyinstaller_raises_nonzero_exit(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -277,22 +372,16 @@ def test_run_pyinstaller_raises_nonzero_exit(
     spec_path = repo_root / "release.spec"
     spec_path.write_text("# fake\n", encoding="utf-8")
 
-    def _failed_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
-        return subprocess.CompletedProcess(
-            args=["pyinstaller", "-y", str(spec_path)],
-            returncode=2,
-            stdout="build log",
-            stderr="error log",
-        )
-
-    monkeypatch.setattr(subprocess, "run", _failed_run)
+    monkeypatch.setattr(
+        subprocess, "Popen", lambda *args, **kwargs: _FakePopen("build log\nerror log\n", 2)
+    )
     caplog.set_level("INFO")
 
-    with pytest.raises(ValueError, match="PyInstaller failed with exit code 2"):
+    with pytest.raises(ValueError, match="PyInstaller failed with exit code 2") as exc_info:
         release._run_pyinstaller(repo_root, spec_path)
+    assert str(exc_info.value).endswith("\nbuild log\nerror log")
     assert "PyInstaller completed with exit code 2" in caplog.text
-    assert "PyInstaller stdout:\nbuild log" in caplog.text
-    assert "PyInstaller stderr:\nerror log" in caplog.text
+    assert "PyInstaller output:\nbuild log\nerror log" in caplog.text
     assert f"PyInstaller build failed for spec '{spec_path}'" in caplog.text
 
 
@@ -304,33 +393,35 @@ def test_run_pyinstaller_logs_streams_on_success(
     spec_path = repo_root / "release.spec"
     spec_path.write_text("# fake\n", encoding="utf-8")
 
-    def _successful_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
-        return subprocess.CompletedProcess(
-            args=["pyinstaller", "-y", str(spec_path)],
-            returncode=0,
-            stdout="success build log",
-            stderr="warning log",
-        )
-
-    monkeypatch.setattr(subprocess, "run", _successful_run)
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        lambda *args, **kwargs: _FakePopen("success build log\nwarning log\n", 0),
+    )
     caplog.set_level("INFO")
 
     release._run_pyinstaller(repo_root, spec_path)
     assert "PyInstaller completed with exit code 0" in caplog.text
-    assert "PyInstaller stdout:\nsuccess build log" in caplog.text
-    assert "PyInstaller stderr:\nwarning log" in caplog.text
+    assert "PyInstaller output:\nsuccess build log\nwarning log" in caplog.text
 
 
-def test_validate_version_manifest_consistency_raises_on_mismatch(tmp_path: Path) -> None:
-    bundle_dir = tmp_path / "bundle"
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-    (bundle_dir / "VERSION").write_text("1.0.0\n", encoding="utf-8")
-    (bundle_dir / "manifest.json").write_text(
-        json.dumps({"version": "9.9.9"}, indent=2) + "\n", encoding="utf-8"
+def test_run_pyinstaller_keeps_only_the_log_tail(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir(parents=True, exist_ok=True)
+    spec_path = repo_root / "release.spec"
+    spec_path.write_text("# fake\n", encoding="utf-8")
+    lines = [f"line {index}" for index in range(release._PYINSTALLER_LOG_TAIL_LINES + 50)]
+
+    monkeypatch.setattr(
+        subprocess, "Popen", lambda *args, **kwargs: _FakePopen("\n".join(lines) + "\n", 1)
     )
 
-    with pytest.raises(ValueError, match="Release metadata mismatch"):
-        release._validate_version_manifest_consistency(bundle_dir)
+    with pytest.raises(ValueError) as exc_info:
+        release._run_pyinstaller(repo_root, spec_path)
+    detail = str(exc_info.value).split("\n", 1)[1]
+    assert detail.splitlines() == lines[-release._PYINSTALLER_LOG_TAIL_LINES :]
 
 
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="shell-script executable test")
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import importlib.util
 import sys
 
 import sitecustomize
 from _pytest.monkeypatch import MonkeyPatch
 
 
+def test_is_pytest_invocation_matches_pytest_entry_points() -> None:
+    assert sitecustomize._is_pytest_invocation(["/usr/local/bin/pytest", "-q"])
+    assert sitecustomize._is_pytest_invocation(["C:\\venv\\Scripts\\pytest.exe"])
+    assert sitecustomize._is_pytest_invocation(["py.test"])
+    assert sitecustomize._is_pytest_invocation(["bin/py.test.exe"])
+    assert not sitecustomize._is_pytest_invocation([])
+    assert not sitecustomize._is_pytest_invocation(["python", "-m", "pytest"])
+    assert not sitecustomize._is_pytest_invocation(["/opt/pytest/tool.py"])
+
+
 def test_strip_pytest_xdist_args_removes_parallel_flags() -> None:
     argv = [
         "pytest",
@@ -27,6 +38,7 @@ def test_strip_pytest_xdist_args_keeps_other_args() -> None:
     stripped = sitecustomize._strip_pytest_xdist_args(argv)
 
     assert stripped == argv
+    assert stripped is argv
 
 
 def test_disable_xdist_cli_flags_for_pytest_keeps_when_xdist_available(
@@ -76,3 +88,18 @@ def test_disable_xdist_cli_flags_for_pytest_keeps_when_keep_env_set(
 
     sitecustomize._disable_xdist_cli_flags_for_pytest()
     assert sys.argv == argv
+
+
+def test_xdist_is_available_caches_find_spec_result(monkeypatch: MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _fake_find_spec(name: str) -> object:
+        calls.append(name)
+        return object()
+
+    monkeypatch.setattr(sitecustomize, "_XDIST_AVAILABLE", None)
+    monkeypatch.setattr(importlib.util, "find_spec", _fake_find_spec)
+
+    assert sitecustomize._xdist_is_available() is True
+    assert sitecustomize._xdist_is_available() is True
+    assert calls == ["xdist"]
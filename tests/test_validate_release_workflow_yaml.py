@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import subprocess
 from pathlib import Path
 
@@ -322,3 +323,25 @@ jobs:
     output = f"{result.stdout}\n{result.stderr}"
     assert result.returncode != 0
     assert "must set retention-days" in output
+
+
+def test_validate_release_workflow_reparses_after_file_changes(tmp_path: Path) -> None:
+    from scripts import validate_release_workflow_yaml as validator
+
+    workflow = tmp_path / "release.yml"
+    _write_workflow(workflow)
+    assert validator.validate_release_workflow(workflow) == []
+    assert validator.validate_release_workflow(workflow) == []
+
+    workflow.write_text(
+        workflow.read_text(encoding="utf-8").replace(
+            "retention-days: 7", "if-no-files-found: error"
+        ),
+        encoding="utf-8",
+    )
+    stat = workflow.stat()
+    os.utime(workflow, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert validator.validate_release_workflow(workflow) == [
+        "actions/upload-artifact must set retention-days"
+    ]